@@ -23,6 +23,7 @@ class Settings(BaseSettings):
 
   # Alpha Vantage API settings (US stock data)
   alpha_vantage_api_key: str = ""
+  alpha_vantage_calls_per_minute: float = 5.0  # Free tier: 5, premium plans: 75+
 
   # Redis settings
   redis_host: str
@@ -2,12 +2,14 @@
 Database connection and session management.
 """
 import logging
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from app.config.settings import settings
 
@@ -20,10 +22,24 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     pool_recycle=3600,
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=1000  # Rows per multi-VALUES INSERT batch
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for coroutine-based services (psycopg 3 provides the asyncio driver).
+# Pooled asyncio connections are bound to the event loop that opened them, and
+# scheduler jobs each run in their own asyncio.run(), so connections are not pooled.
+async_engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    poolclass=NullPool,
+    insertmanyvalues_page_size=1000
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -54,6 +70,20 @@ def get_db_session() -> Generator[Session, None, None]:
     db.close()
 
 
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+  """
+  Async context manager for database session.
+  """
+  async with AsyncSessionLocal() as db:
+    try:
+      yield db
+      await db.commit()
+    except Exception:
+      await db.rollback()
+      raise
+
+
 def init_db():
   """
   Initialize database tables (if needed).
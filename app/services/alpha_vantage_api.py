@@ -18,6 +18,10 @@ logger = logging.getLogger(__name__)
 # Redis keys for US market data
 US_TOKEN_REDIS_KEY = "us:alpha_vantage_token"
 US_RATE_LIMIT_KEY = "us:rate_limit"
+US_DAILY_PRICES_KEY = "us:daily_prices"  # + ":{symbol}:{outputsize}"
+
+# Parsed daily prices are cached so reruns within the hour don't spend the API quota again
+DAILY_PRICES_CACHE_TTL = 3600
 
 
 class AlphaVantageAPIClient:
@@ -28,8 +32,11 @@ class AlphaVantageAPIClient:
         self.api_key = settings.alpha_vantage_api_key
         self.base_url = "https://www.alphavantage.co/query"
         
-        # Rate limiting: 5 calls per minute for free tier = 5/60 calls per second
-        self.rate_limiter = APIRateLimiter(calls_per_second=5.0/60.0)
+        # Rate limiting: calls per minute for the plan (free tier: 5) converted to calls per second
+        self.rate_limiter = APIRateLimiter(calls_per_second=settings.alpha_vantage_calls_per_minute / 60.0)
+        
+        # Shared pooled session so keep-alive connections survive across symbols
+        self.session = APIUtils.get_shared_session()
         
         if not self.api_key:
             logger.warning("Alpha Vantage API key not provided")
@@ -42,38 +49,46 @@ class AlphaVantageAPIClient:
         params['apikey'] = self.api_key
         
         try:
-            with APIUtils.create_session_with_retries() as session:
-                response = session.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Check for Alpha Vantage specific errors
-                error_msg = AlphaVantageAPIUtils.extract_error_message(data)
-                if error_msg:
-                    logger.error(f"Alpha Vantage API error: {error_msg}")
-                    return {}
-                
-                return data
-                
+            response = self.session.get(self.base_url, params=params, timeout=30)
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            # Check for Alpha Vantage specific errors (returned with HTTP 200)
+            if any(key in data for key in ('Error Message', 'Note', 'Information')):
+                error_msg = AlphaVantageAPIUtils.extract_alpha_vantage_error(data)
+                logger.error(f"Alpha Vantage API error: {error_msg}")
+                return {}
+            
+            return data
+            
         except requests.exceptions.RequestException as e:
             logger.error(f"Alpha Vantage API request failed: {e}")
             return {}
 
-    def get_daily_prices(self, symbol: str, outputsize: str = "compact") -> List[Dict]:
+    def get_daily_prices(self, symbol: str, outputsize: str = "compact",
+                         use_cache: bool = True) -> List[Dict]:
         """
         Get daily stock prices for US stocks.
         
         Args:
             symbol: Stock symbol (e.g., "AAPL", "MSFT")
             outputsize: "compact" (100 days) or "full" (20+ years)
+            use_cache: Return prices cached in Redis within DAILY_PRICES_CACHE_TTL
         
         Returns:
             List of daily price data
         """
-        if not DataValidationUtils.is_valid_stock_symbol(symbol):
+        if not DataValidationUtils.validate_stock_code(symbol):
             logger.error(f"Invalid stock symbol: {symbol}")
             return []
+        
+        cache_key = f"{US_DAILY_PRICES_KEY}:{symbol}:{outputsize}"
+        if use_cache:
+            cached_prices = redis_client.get_json(cache_key)
+            if cached_prices:
+                logger.debug(f"Using cached daily prices for {symbol} from Redis")
+                return cached_prices
             
         params = {
             'function': 'TIME_SERIES_DAILY_ADJUSTED',
@@ -94,7 +109,7 @@ class AlphaVantageAPIClient:
             prices = []
             for date_str, price_data in time_series.items():
                 # Validate date format
-                if not DataValidationUtils.is_valid_date_format(date_str):
+                if DateUtils.parse_date_string(date_str, "%Y-%m-%d") is None:
                     logger.warning(f"Invalid date format in response: {date_str}")
                     continue
                     
@@ -119,6 +134,8 @@ class AlphaVantageAPIClient:
             prices.sort(key=lambda x: x['date'], reverse=True)
             
             logger.info(f"Retrieved {len(prices)} days of data for {symbol}")
+            if prices:
+                redis_client.set_json(cache_key, prices, ttl=DAILY_PRICES_CACHE_TTL)
             return prices
             
         except Exception as e:
@@ -127,7 +144,7 @@ class AlphaVantageAPIClient:
 
     def get_company_overview(self, symbol: str) -> Dict:
         """Get company fundamental data."""
-        if not DataValidationUtils.is_valid_stock_symbol(symbol):
+        if not DataValidationUtils.validate_stock_code(symbol):
             logger.error(f"Invalid stock symbol: {symbol}")
             return {}
             
@@ -297,7 +314,7 @@ class AlphaVantageAPIClient:
         results = {}
         
         for i, symbol in enumerate(symbols):
-            if not DataValidationUtils.is_valid_stock_symbol(symbol):
+            if not DataValidationUtils.validate_stock_code(symbol):
                 logger.warning(f"Skipping invalid symbol: {symbol}")
                 continue
                 
@@ -313,7 +330,7 @@ class AlphaVantageAPIClient:
                 results[symbol] = {
                     'prices': prices,
                     'overview': overview,
-                    'timestamp': DateUtils.get_current_datetime().isoformat()
+                    'timestamp': datetime.now().isoformat()
                 }
                 
                 # Rate limiting - use the built-in rate limiter
@@ -326,7 +343,7 @@ class AlphaVantageAPIClient:
                     'prices': [],
                     'overview': {},
                     'error': str(e),
-                    'timestamp': DateUtils.get_current_datetime().isoformat()
+                    'timestamp': datetime.now().isoformat()
                 }
         
         return results
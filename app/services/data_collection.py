@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, date
 from typing import List, Dict, Optional
 
 import pandas as pd
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
 from app.database.connection import get_db_session
@@ -71,13 +71,13 @@ class DataCollectionService:
                 
                 for stock in kr_stocks:
                     try:
-                        # 최신 데이터 확인
-                        latest_data = db.query(StockDailyPrice).filter_by(
+                        # 최신 거래일 확인 (ORM 객체 로딩 없이 스칼라 조회)
+                        latest_date = db.query(func.max(StockDailyPrice.trade_date)).filter_by(
                             stock_id=stock.stock_id
-                        ).order_by(StockDailyPrice.trade_date.desc()).first()
+                        ).scalar()
                         
                         # 오늘 데이터가 이미 있으면 스킵
-                        if latest_data and latest_data.trade_date >= today:
+                        if latest_date and latest_date >= today:
                             continue
                         
                         # KIS API로 최신 데이터 수집
@@ -120,13 +120,13 @@ class DataCollectionService:
                 
                 for stock in us_stocks:
                     try:
-                        # 최신 데이터 확인
-                        latest_data = db.query(StockDailyPrice).filter_by(
+                        # 최신 거래일 확인 (ORM 객체 로딩 없이 스칼라 조회)
+                        latest_date = db.query(func.max(StockDailyPrice.trade_date)).filter_by(
                             stock_id=stock.stock_id
-                        ).order_by(StockDailyPrice.trade_date.desc()).first()
+                        ).scalar()
                         
                         # 오늘 데이터가 이미 있으면 스킵
-                        if latest_data and latest_data.trade_date >= today:
+                        if latest_date and latest_date >= today:
                             continue
                         
                         # Alpha Vantage API로 최신 데이터 수집
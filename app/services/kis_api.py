@@ -2,6 +2,7 @@
 KIS (Korea Investment & Securities) API client for stock data.
 """
 import logging
+import threading
 import time
 from typing import Dict, List
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Redis key for KIS access token
 KIS_TOKEN_REDIS_KEY = "kis:access_token"
 
+# Serializes token issuance so concurrent fetches on a cache miss issue only one token
+_token_lock = threading.Lock()
+
 
 class KISAPIClient:
   """KIS Open API client for fetching stock data with improved utilities."""
@@ -29,8 +33,8 @@ class KISAPIClient:
     # Initialize rate limiter
     self.rate_limiter = APIRateLimiter(calls_per_second=settings.api_rate_limit_delay or 10.0)
     
-    # Create session with retries
-    self.session = APIUtils.create_session_with_retries()
+    # Shared session with retries (keep-alive connections reused across clients)
+    self.session = APIUtils.get_shared_session()
 
     if not self.app_key or not self.app_secret:
       logger.warning("KIS API credentials not provided")
@@ -46,9 +50,16 @@ class KISAPIClient:
       logger.debug("Using cached KIS access token from Redis")
       return cached_token
 
-    # If no cached token, issue new one
-    logger.info("Issuing new KIS access token")
-    return self._issue_new_token()
+    # If no cached token, issue new one (re-check after acquiring the lock,
+    # another thread may have issued it while we waited)
+    with _token_lock:
+      cached_token = redis_client.get(KIS_TOKEN_REDIS_KEY)
+      if cached_token:
+        logger.debug("Using KIS access token issued by another thread")
+        return cached_token
+
+      logger.info("Issuing new KIS access token")
+      return self._issue_new_token()
 
   def _issue_new_token(self) -> str:
     """Issue new access token from KIS API and cache it."""
@@ -61,7 +72,7 @@ class KISAPIClient:
     }
 
     try:
-      response = requests.post(url, headers=headers, json=data)
+      response = self.session.post(url, headers=headers, json=data)
       response.raise_for_status()
 
       result = response.json()
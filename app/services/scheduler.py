@@ -2,9 +2,11 @@
 Scheduling service for automated stock analysis and recommendations.
 """
 import atexit
+import functools
 import logging
 import time
 from datetime import datetime, date, timedelta
+from pathlib import Path
 
 import schedule
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -19,9 +21,24 @@ from app.services.recommendation import RecommendationService
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=7)
+def _next_weekday_offset(weekday: int) -> int:
+  """Days from the given weekday (Mon=0) to the next business day."""
+  return (1, 1, 1, 1, 3, 2, 1)[weekday]
+
+
 class SchedulingService:
   """Service for scheduling automated stock analysis tasks."""
 
+  # Cron triggers are stateless, so they are built once at class load
+  _DAILY_TRIG = CronTrigger(day_of_week='mon-fri', hour=16, minute=0)  # 평일 16:00
+  _MORNING_TRIG = CronTrigger(day_of_week='mon-fri', hour=8, minute=30)  # 평일 08:30
+  _ML_TRAINING_TRIG = CronTrigger(hour=6, minute=30)  # 매일 06:30
+  _WEEKLY_TRAINING_TRIG = CronTrigger(day_of_week='sun', hour=2, minute=0)  # 일요일 02:00
+  _MONTHLY_UNIVERSE_TRIG = CronTrigger(day_of_week='sun', hour=1, minute=0, day='1-7')  # 첫째 일요일 01:00
+  _WEEKLY_REPORT_TRIG = CronTrigger(day_of_week='sun', hour=18, minute=0)  # 일요일 18:00
+  _TOKEN_REFRESH_TRIG = CronTrigger(hour=0, minute=0)  # 매일 자정
+
   def __init__(self):
     self.data_service = DataCollectionService()
     self.recommendation_service = RecommendationService()
@@ -30,6 +47,10 @@ class SchedulingService:
     self.scheduler = BackgroundScheduler()
     self.universe_id = settings.default_universe_id or 1
 
+    # Recommendation cache directory (created once, not on every save)
+    self._cache_dir = Path("cache")
+    self._cache_dir.mkdir(exist_ok=True)
+
     # Configure scheduler
     self.scheduler.start()
     atexit.register(lambda: self.scheduler.shutdown())
@@ -40,94 +61,25 @@ class SchedulingService:
     """Setup all scheduled tasks."""
     try:
       # Daily data collection and recommendations (평일 오후 4시 - 장 마감 후)
-      self.scheduler.add_job(
-          func=self.daily_recommendation_task,
-          trigger=CronTrigger(
-              day_of_week='mon-fri',  # 월-금
-              hour=16,  # 오후 4시
-              minute=0
-          ),
-          id='daily_recommendations',
-          replace_existing=True,
-          misfire_grace_time=1800  # 30분 grace time
-      )
+      self._add('daily_recommendations', self.daily_recommendation_task, self._DAILY_TRIG, 1800)
 
       # Morning notification (평일 오전 8시 30분 - 장 시작 전)
-      self.scheduler.add_job(
-          func=self.morning_notification_task,
-          trigger=CronTrigger(
-              day_of_week='mon-fri',  # 월-금
-              hour=8,  # 오전 8시
-              minute=30
-          ),
-          id='morning_notifications',
-          replace_existing=True,
-          misfire_grace_time=900  # 15분 grace time
-      )
+      self._add('morning_notifications', self.morning_notification_task, self._MORNING_TRIG, 900)
 
       # Daily ML adaptive training (매일 오전 6시 30분)
-      self.scheduler.add_job(
-          func=self.daily_ml_training_task,
-          trigger=CronTrigger(
-              hour=6,  # 오전 6시
-              minute=30  # 30분
-          ),
-          id='daily_ml_training',
-          replace_existing=True,
-          misfire_grace_time=900  # 15분 grace time
-      )
+      self._add('daily_ml_training', self.daily_ml_training_task, self._ML_TRAINING_TRIG, 900)
 
       # Weekly advanced training (일요일 오전 2시)
-      self.scheduler.add_job(
-          func=self.weekly_advanced_training_task,
-          trigger=CronTrigger(
-              day_of_week='sun',  # 일요일
-              hour=2,  # 오전 2시
-              minute=0
-          ),
-          id='weekly_advanced_training',
-          replace_existing=True,
-          misfire_grace_time=3600  # 1시간 grace time
-      )
+      self._add('weekly_advanced_training', self.weekly_advanced_training_task, self._WEEKLY_TRAINING_TRIG, 3600)
 
       # Monthly universe update (매월 첫째 일요일 오전 1시)
-      self.scheduler.add_job(
-          func=self.monthly_universe_update_task,
-          trigger=CronTrigger(
-              day_of_week='sun',  # 일요일
-              hour=1,  # 오전 1시
-              minute=0,
-              day='1-7'  # 매월 1-7일 중 일요일
-          ),
-          id='monthly_universe_update',
-          replace_existing=True,
-          misfire_grace_time=7200  # 2시간 grace time
-      )
+      self._add('monthly_universe_update', self.monthly_universe_update_task, self._MONTHLY_UNIVERSE_TRIG, 7200)
 
       # Weekly performance report (일요일 오후 6시)
-      self.scheduler.add_job(
-          func=self.weekly_performance_report_task,
-          trigger=CronTrigger(
-              day_of_week='sun',  # 일요일
-              hour=18,  # 오후 6시
-              minute=0
-          ),
-          id='weekly_performance_report',
-          replace_existing=True,
-          misfire_grace_time=1800  # 30분 grace time
-      )
+      self._add('weekly_performance_report', self.weekly_performance_report_task, self._WEEKLY_REPORT_TRIG, 1800)
 
       # KIS token refresh (매일 자정 00:00) - KIS API 권장사항
-      self.scheduler.add_job(
-          func=self.kis_token_refresh_task,
-          trigger=CronTrigger(
-              hour=0,  # 자정 00:00
-              minute=0
-          ),
-          id='kis_token_refresh',
-          replace_existing=True,
-          misfire_grace_time=1800  # 30분 grace time
-      )
+      self._add('kis_token_refresh', self.kis_token_refresh_task, self._TOKEN_REFRESH_TRIG, 1800)
 
       logger.info("All scheduled tasks configured successfully")
       self._log_scheduled_jobs()
@@ -136,6 +88,18 @@ class SchedulingService:
       logger.error(f"Failed to setup schedules: {e}")
       raise
 
+  def _add(self, job_id: str, func, trig: CronTrigger, grace: int):
+    """Register a cron job; overlapping or missed runs collapse into one."""
+    self.scheduler.add_job(
+        func=func,
+        trigger=trig,
+        id=job_id,
+        replace_existing=True,
+        misfire_grace_time=grace,
+        coalesce=True,
+        max_instances=1
+    )
+
   def daily_recommendation_task(self):
     """Daily task: collect data and generate recommendations."""
     logger.info("Starting daily recommendation task")
@@ -181,11 +145,9 @@ class SchedulingService:
       # 2. Generate recommendations for tomorrow
       logger.info("Step 2: Generating recommendations")
 
-      tomorrow = date.today() + timedelta(days=1)
-
-      # Skip weekend
-      while tomorrow.weekday() >= 5:
-        tomorrow += timedelta(days=1)
+      # Next business day (skips weekend)
+      today = date.today()
+      tomorrow = today + timedelta(days=_next_weekday_offset(today.weekday()))
 
       recommendations = self.recommendation_service.generate_recommendations(
           universe_id=self.universe_id,
@@ -412,14 +374,9 @@ class SchedulingService:
     """Save recommendations for morning notification."""
     try:
       import json
-      import os
-
-      # Create cache directory
-      cache_dir = "cache"
-      os.makedirs(cache_dir, exist_ok=True)
 
       filename = f"recommendations_{target_date.strftime('%Y%m%d')}.json"
-      filepath = os.path.join(cache_dir, filename)
+      filepath = self._cache_dir / filename
 
       with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(recommendations, f, ensure_ascii=False, indent=2, default=str)
@@ -433,12 +390,11 @@ class SchedulingService:
     """Load recommendations for notification."""
     try:
       import json
-      import os
 
       filename = f"recommendations_{target_date.strftime('%Y%m%d')}.json"
-      filepath = os.path.join("cache", filename)
+      filepath = self._cache_dir / filename
 
-      if not os.path.exists(filepath):
+      if not filepath.exists():
         logger.warning(f"Recommendations file not found: {filepath}")
         return []
 
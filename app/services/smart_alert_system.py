@@ -8,12 +8,22 @@
 import sys
 from pathlib import Path
 from datetime import datetime, time, timedelta
+from time import monotonic, time as unix_time
 from typing import List, Dict, Any, Optional
 import asyncio
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
-import pytz
+from functools import cached_property
+from zoneinfo import ZoneInfo
 import json
+import httpx
+import numpy as np
+
+try:
+    from discord_webhook import DiscordWebhook, DiscordEmbed
+except ImportError:  # Discord 알림은 선택 기능
+    DiscordWebhook = DiscordEmbed = None
 
 # Add app directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent / "app"))
@@ -22,10 +32,83 @@ from app.database.connection import get_db_session
 from app.models.entities import StockMaster, MarketRegion
 from app.ml.global_ml_engine import GlobalMLEngine, MarketRegime, GlobalPrediction
 from app.services.notification import NotificationService
+from app.services.telegram_service import truncate_message
 from app.utils.market_time_utils import MarketTimeManager
 from app.config.settings import settings
 
 
+# ML 호출 결과 캐시 유효 시간 (초)
+REGIME_CACHE_TTL = 300
+PREDICTION_CACHE_TTL = 60
+
+# 시장 체제/추천 등급 표시용 조회 테이블
+_REGIME_EMOJI = {
+    MarketRegime.BULL_MARKET: "🐂",
+    MarketRegime.BEAR_MARKET: "🐻",
+    MarketRegime.SIDEWAYS_MARKET: "🦀",
+    MarketRegime.HIGH_VOLATILITY: "⚡",
+    MarketRegime.CRISIS_MODE: "🚨"
+}
+
+_REGIME_NAME = {
+    MarketRegime.BULL_MARKET: "강세장",
+    MarketRegime.BEAR_MARKET: "약세장",
+    MarketRegime.SIDEWAYS_MARKET: "횡보장",
+    MarketRegime.HIGH_VOLATILITY: "고변동성",
+    MarketRegime.CRISIS_MODE: "위기상황"
+}
+
+_REC_EMOJI = {
+    "STRONG_BUY": "🚀",
+    "BUY": "📈",
+    "HOLD": "⏸️",
+    "SELL": "📉",
+    "STRONG_SELL": "🔻"
+}
+
+# 장 마감 요약은 매수 등급만 강조
+_CLOSE_REC_EMOJI = {"STRONG_BUY": "🚀", "BUY": "📈"}
+
+# 긴급도별 Discord embed 색상
+_ALERT_COLORS = {
+    "LOW": 0x00FF00,      # 초록
+    "MEDIUM": 0xFFFF00,   # 노랑
+    "HIGH": 0xFF8C00,     # 주황
+    "CRITICAL": 0xFF0000  # 빨강
+}
+
+# 미국 시장 운영 시간 안내 템플릿
+_US_SCHEDULE_TMPL = (
+    "🕐 **{day} 미국 시장 운영 시간**\n"
+    "📅 {date}\n"
+    "🌍 {dst}\n"
+    "• 프리마켓: {pre_us} (현지) / {pre_kr} (한국)\n"
+    "• 정규장: {reg_us} (현지) / {reg_kr} (한국)\n"
+    "• 애프터마켓: {aft_us} (현지) / {aft_kr} (한국)\n\n"
+)
+
+# 한국 시장 운영 시간 안내 (고정 시간)
+_KR_SCHEDULE_INFO = (
+    "🕐 **내일 한국 시장 운영 시간**\n"
+    "• 정규장: 09:00 - 15:30 (한국시간)\n"
+    "• 동시호가: 08:30 - 09:00, 15:30 - 16:00\n\n"
+)
+
+# 하락장 경고의 현재 시장 상태별 대응 안내
+_STATUS_ACTION = {
+    '정규장': "⚠️ 현재 거래 시간 중입니다 - 즉시 대응 필요\n",
+    '프리마켓': "📈 프리마켓 시간 - 정규장 전 대응 준비\n",
+    '애프터마켓': "📉 애프터마켓 - 다음 거래일 대응 계획 수립\n"
+}
+_CLOSED_STATUS_ACTION = "🛑 시장 마감 - 다음 거래일 대응 준비\n"
+
+# 시간대별 알림 전송 구간 길이 (분)
+ALERT_WINDOW_MINUTES = 30
+
+# 메시지 플랫폼 제한
+DISCORD_MAX_DESCRIPTION = 2000
+
+
 class AlertType(Enum):
     """알림 유형"""
     PREMARKET_RECOMMENDATIONS = "premarket_recommendations"
@@ -36,6 +119,15 @@ class AlertType(Enum):
     CRISIS_MODE_ALERT = "crisis_mode_alert"
 
 
+# 알림 유형별 재전송 대기 시간 (시간)
+ALERT_COOLDOWN_HOURS = {
+    AlertType.PREMARKET_RECOMMENDATIONS: 6,
+    AlertType.BEAR_MARKET_WARNING: 4,
+    AlertType.MARKET_REGIME_CHANGE: 8
+}
+DEFAULT_ALERT_COOLDOWN_HOURS = 1
+
+
 class MarketTime(Enum):
     """시장 시간대"""
     KR_MARKET_OPEN = "09:00"  # 한국 시장 개장
@@ -57,102 +149,211 @@ class SmartAlert:
     action_required: bool
     recommendations: List[str]
     created_at: datetime
+    short_message: str = field(init=False, repr=False)  # Discord 본문 (생성 시 1회 절단)
+    
+    def __post_init__(self):
+        self.short_message = self.message[:DISCORD_MAX_DESCRIPTION]
+
+
+def _format_us_schedule(day: str, schedule: Dict[str, Any], dst_status: str) -> str:
+    """미국 시장 운영 시간 안내 문구"""
+    return _US_SCHEDULE_TMPL.format(
+        day=day,
+        date=schedule['today_date'],
+        dst=dst_status,
+        pre_us=schedule['premarket']['us_time'],
+        pre_kr=schedule['premarket']['kr_time'],
+        reg_us=schedule['regular']['us_time'],
+        reg_kr=schedule['regular']['kr_time'],
+        aft_us=schedule['aftermarket']['us_time'],
+        aft_kr=schedule['aftermarket']['kr_time']
+    )
+
+
+def _predicted_returns(predictions: List[GlobalPrediction]) -> np.ndarray:
+    """예측 목록의 예상 수익률 배열"""
+    return np.fromiter((p.predicted_return for p in predictions), dtype=np.float64, count=len(predictions))
+
+
+@dataclass
+class AlertContext:
+    """알림 주기(tick)별 공유 시장 정보 - 한 번 계산해 모든 알림 생성기에서 재사용"""
+    market_time_manager: MarketTimeManager
+    kr_now: datetime
+    kr_time_str: str = field(init=False)
+    
+    def __post_init__(self):
+        # 같은 주기의 알림은 모두 동일한 시각 표기를 사용
+        self.kr_time_str = self.kr_now.strftime('%m/%d %H:%M KST')
+    
+    @cached_property
+    def market_schedule(self) -> Dict[str, Any]:
+        return self.market_time_manager.get_market_schedule_info()
+    
+    @cached_property
+    def tomorrow_schedule(self) -> Dict[str, Any]:
+        return self.market_time_manager.get_market_schedule_info(days_offset=1)
+    
+    @cached_property
+    def dst_status(self) -> str:
+        return self.market_time_manager.format_dst_status()
+    
+    @cached_property
+    def current_status(self) -> Dict[str, Any]:
+        return self.market_time_manager.get_current_market_status()
 
 
 class SmartAlertSystem:
     """스마트 알림 시스템"""
     
     def __init__(self):
-        self.ml_engine = GlobalMLEngine()
-        self.notification_service = NotificationService()
-        self.market_time_manager = MarketTimeManager()
-        
         # 시간대 설정
-        self.kr_timezone = pytz.timezone('Asia/Seoul')
-        self.us_timezone = pytz.timezone('America/New_York')
+        self.kr_timezone = ZoneInfo('Asia/Seoul')
+        self.us_timezone = ZoneInfo('America/New_York')
         
-        # 마지막 알림 시간 추적
-        self.last_alerts = {}
+        # 알림 전송 구간 캐시: key -> (당일 종료 시각, 시작, 종료) UTC epoch 초
+        self._alert_windows: Dict[str, tuple] = {}
+        
+        # 알림 유형별 다음 전송 가능 시각 (monotonic 초)
+        self._next_eligible: Dict[AlertType, float] = {}
+        
+        # 공유 HTTP 클라이언트 (최초 전송 시 생성)
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # ML 호출 결과 캐시: key -> (값, 만료 시각), 로딩 중인 호출은 key -> Task
+        self._ml_cache: Dict[tuple, tuple] = {}
+        self._ml_loading: Dict[tuple, asyncio.Task] = {}
+        
+        # GlobalMLEngine 은 스레드 안전하지 않으므로 엔진 호출은 한 번에 하나씩
+        self._ml_engine_lock = threading.Lock()
         
         print("📢 스마트 알림 시스템 초기화")
     
+    async def _cached_regime(self):
+        """시장 체제 분석 (REGIME_CACHE_TTL 동안 재사용)"""
+        return await self._cached_ml_call(('regime',), REGIME_CACHE_TTL, self.ml_engine.detect_market_regime)
+    
+    async def _cached_predictions(self, region: MarketRegion, top_n: int) -> List[GlobalPrediction]:
+        """종목 예측 (region, top_n 별로 PREDICTION_CACHE_TTL 동안 재사용)"""
+        return await self._cached_ml_call(('predictions', region, top_n), PREDICTION_CACHE_TTL,
+                                          self.ml_engine.predict_stocks, region, top_n=top_n)
+    
+    async def _cached_ml_call(self, key: tuple, ttl: float, func, *args, **kwargs):
+        """ML 호출 결과를 ttl 초 동안 재사용 (동시에 캐시를 놓친 호출자는 같은 로딩 Task 를 함께 기다림)"""
+        cached = self._ml_cache.get(key)
+        if cached is not None and cached[1] > monotonic():
+            return cached[0]
+        
+        task = self._ml_loading.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load_ml(key, ttl, func, *args, **kwargs))
+            self._ml_loading[key] = task
+        # 한 호출자가 취소되어도 다른 호출자가 기다리는 로딩은 계속 진행
+        return await asyncio.shield(task)
+    
+    async def _load_ml(self, key: tuple, ttl: float, func, *args, **kwargs):
+        """ML 엔진 호출 후 결과 캐시 (실패 시 캐시하지 않아 다음 호출에서 재시도)"""
+        try:
+            # 동기 ML 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+            value = await asyncio.to_thread(self._call_ml_engine, func, *args, **kwargs)
+            self._ml_cache[key] = (value, monotonic() + ttl)
+            return value
+        finally:
+            if self._ml_loading.get(key) is asyncio.current_task():
+                del self._ml_loading[key]
+    
+    def _call_ml_engine(self, func, *args, **kwargs):
+        """엔진 잠금을 잡고 ML 엔진 메서드 호출 (작업 스레드에서 실행)"""
+        with self._ml_engine_lock:
+            return func(*args, **kwargs)
+    
+    # 무거운 의존 객체는 최초 사용 시 생성
+    @cached_property
+    def ml_engine(self) -> GlobalMLEngine:
+        return GlobalMLEngine()
+    
+    @cached_property
+    def notification_service(self) -> NotificationService:
+        return NotificationService()
+    
+    @cached_property
+    def market_time_manager(self) -> MarketTimeManager:
+        return MarketTimeManager()
+    
+    def build_context(self) -> AlertContext:
+        """알림 주기 공유 컨텍스트 생성 (시장 시간 정보는 최초 사용 시 계산)"""
+        return AlertContext(
+            market_time_manager=self.market_time_manager,
+            kr_now=datetime.now(self.kr_timezone)
+        )
+    
+    def _in_daily_window(self, key: str, tz: ZoneInfo, hour: int, minute: int) -> bool:
+        """현지 시각 hour:minute 부터 ALERT_WINDOW_MINUTES 동안인지 확인 (구간은 하루 한 번 계산)"""
+        now = unix_time()
+        window = self._alert_windows.get(key)
+        
+        if window is None or now >= window[0]:
+            today = datetime.now(tz).date()
+            start = datetime.combine(today, time(hour, minute), tzinfo=tz).timestamp()
+            day_end = datetime.combine(today + timedelta(days=1), time(0), tzinfo=tz).timestamp()
+            window = (day_end, start, start + ALERT_WINDOW_MINUTES * 60)
+            self._alert_windows[key] = window
+        
+        return window[1] <= now <= window[2]
+    
     def should_send_premarket_alert(self) -> bool:
         """프리마켓 알림 전송 시점 확인"""
-        now_kr = datetime.now(self.kr_timezone)
-        target_time = now_kr.replace(hour=6, minute=0, second=0, microsecond=0)
-        
         # 06:00 ~ 06:30 사이에만 전송
-        return target_time <= now_kr <= target_time + timedelta(minutes=30)
+        return self._in_daily_window("premarket", self.kr_timezone, 6, 0)
     
     def should_send_market_close_alert(self, region: MarketRegion) -> bool:
         """장 마감 후 알림 전송 시점 확인"""
         if region == MarketRegion.KR:
-            now = datetime.now(self.kr_timezone)
             # 한국: 15:30 마감 후 16:00에 알림
-            target_time = now.replace(hour=16, minute=0, second=0, microsecond=0)
-            return target_time <= now <= target_time + timedelta(minutes=30)
+            return self._in_daily_window("kr_close", self.kr_timezone, 16, 0)
         
         elif region == MarketRegion.US:
-            now = datetime.now(self.us_timezone)
             # 미국: 16:00 마감 후 16:30에 알림 (현지시간)
-            target_time = now.replace(hour=16, minute=30, second=0, microsecond=0)
-            return target_time <= now <= target_time + timedelta(minutes=30)
+            return self._in_daily_window("us_close", self.us_timezone, 16, 30)
         
         return False
     
-    def generate_premarket_alert(self) -> Optional[SmartAlert]:
+    async def generate_premarket_alert(self, ctx: Optional[AlertContext] = None) -> Optional[SmartAlert]:
         """미국 프리마켓 알림 생성"""
         print("🌅 US 프리마켓 알림 생성 중...")
         
         try:
+            ctx = ctx or self.build_context()
+            
             # 시장 체제 분석
-            market_condition = self.ml_engine.detect_market_regime()
+            market_condition = await self._cached_regime()
             
             # 미국 주식 예측
-            us_predictions = self.ml_engine.predict_stocks(MarketRegion.US, top_n=5)
+            us_predictions = await self._cached_predictions(MarketRegion.US, top_n=5)
             
             if not us_predictions:
                 print("   ⚠️ 미국 예측 데이터 없음")
                 return None
             
             # 시장 시간 정보 가져오기
-            market_schedule = self.market_time_manager.get_market_schedule_info()
-            dst_status = self.market_time_manager.format_dst_status()
+            market_schedule = ctx.market_schedule
+            dst_status = ctx.dst_status
             
             # 알림 메시지 구성 (한국 시간대 명시)
-            kr_time_str = datetime.now(self.kr_timezone).strftime('%m/%d %H:%M KST')
-            title = f"🇺🇸 미국 프리마켓 추천 종목 ({kr_time_str})"
+            title = f"🇺🇸 미국 프리마켓 추천 종목 ({ctx.kr_time_str})"
             
             # 시장 운영 시간 정보 추가
-            time_info = f"🕐 **오늘 미국 시장 운영 시간**\n"
-            time_info += f"📅 {market_schedule['today_date']}\n"
-            time_info += f"🌍 {dst_status}\n"
-            time_info += f"• 프리마켓: {market_schedule['premarket']['us_time']} (현지) / {market_schedule['premarket']['kr_time']} (한국)\n"
-            time_info += f"• 정규장: {market_schedule['regular']['us_time']} (현지) / {market_schedule['regular']['kr_time']} (한국)\n"
-            time_info += f"• 애프터마켓: {market_schedule['aftermarket']['us_time']} (현지) / {market_schedule['aftermarket']['kr_time']} (한국)\n\n"
+            time_info = _format_us_schedule("오늘", market_schedule, dst_status)
             
             # 시장 상황 요약
-            regime_emoji = {
-                MarketRegime.BULL_MARKET: "🐂",
-                MarketRegime.BEAR_MARKET: "🐻", 
-                MarketRegime.SIDEWAYS_MARKET: "🦀",
-                MarketRegime.HIGH_VOLATILITY: "⚡",
-                MarketRegime.CRISIS_MODE: "🚨"
-            }
-            
-            regime_name = {
-                MarketRegime.BULL_MARKET: "강세장",
-                MarketRegime.BEAR_MARKET: "약세장",
-                MarketRegime.SIDEWAYS_MARKET: "횡보장", 
-                MarketRegime.HIGH_VOLATILITY: "고변동성",
-                MarketRegime.CRISIS_MODE: "위기상황"
-            }
-            
-            market_summary = f"{regime_emoji.get(market_condition.regime, '📊')} **시장 체제 분석**\n"
-            market_summary += f"• 현재 체제: {regime_name.get(market_condition.regime, '분석중')}\n"
-            market_summary += f"• 변동성: {market_condition.volatility_level:.1%}\n"
-            market_summary += f"• 공포/탐욕: {market_condition.fear_greed_index:.0f}/100\n"
-            market_summary += f"• 리스크: {market_condition.risk_level}\n\n"
+            market_summary = "".join([
+                f"{_REGIME_EMOJI.get(market_condition.regime, '📊')} **시장 체제 분석**\n",
+                f"• 현재 체제: {_REGIME_NAME.get(market_condition.regime, '분석중')}\n",
+                f"• 변동성: {market_condition.volatility_level:.1%}\n",
+                f"• 공포/탐욕: {market_condition.fear_greed_index:.0f}/100\n",
+                f"• 리스크: {market_condition.risk_level}\n\n"
+            ])
             
             # 추천 종목 정보
             stock_info = []
@@ -160,28 +361,22 @@ class SmartAlertSystem:
             
             for i, pred in enumerate(us_predictions[:5], 1):
                 # 추천 등급 이모지
-                rec_emoji = {
-                    "STRONG_BUY": "🚀",
-                    "BUY": "📈", 
-                    "HOLD": "⏸️",
-                    "SELL": "📉",
-                    "STRONG_SELL": "🔻"
-                }
-                
-                emoji = rec_emoji.get(pred.recommendation, "📊")
+                emoji = _REC_EMOJI.get(pred.recommendation, "📊")
                 
-                stock_line = f"{i}. {emoji} **{pred.stock_code}** "
-                stock_line += f"예상 수익률: **{pred.predicted_return:+.1f}%** "
-                stock_line += f"({pred.recommendation})"
+                stock_lines = [
+                    f"{i}. {emoji} **{pred.stock_code}** "
+                    f"예상 수익률: **{pred.predicted_return:+.1f}%** "
+                    f"({pred.recommendation})"
+                ]
                 
                 if pred.target_price:
-                    stock_line += f"\n   💰 목표가: ${pred.target_price:.2f}"
+                    stock_lines.append(f"   💰 목표가: ${pred.target_price:.2f}")
                 
                 if pred.reasoning:
                     main_reason = pred.reasoning[0] if pred.reasoning else "기술적 분석"
-                    stock_line += f"\n   📝 {main_reason}"
+                    stock_lines.append(f"   📝 {main_reason}")
                 
-                message_lines.append(stock_line)
+                message_lines.append("\n".join(stock_lines))
                 
                 # 구조화된 데이터
                 stock_info.append({
@@ -216,15 +411,17 @@ class SmartAlertSystem:
                 ])
             
             # 최종 메시지
-            message = "\n".join(message_lines)
+            parts: List[str] = ["\n".join(message_lines)]
             
             if recommendations:
-                message += "\n\n🎯 **투자 조언**\n"
-                message += "\n".join(f"• {rec}" for rec in recommendations)
+                parts.append("\n\n🎯 **투자 조언**\n")
+                parts.append("\n".join(f"• {rec}" for rec in recommendations))
             
             # 긴급도 결정
             urgency_level = "HIGH" if market_condition.risk_level in ["HIGH", "CRITICAL"] else "MEDIUM"
             
+            message = "".join(parts)
+            
             alert = SmartAlert(
                 alert_type=AlertType.PREMARKET_RECOMMENDATIONS,
                 market_region="US",
@@ -244,7 +441,8 @@ class SmartAlertSystem:
             print(f"   ❌ 프리마켓 알림 생성 실패: {e}")
             return None
     
-    async def generate_korean_premarket_recommendations(self, predictions: List[GlobalPrediction]) -> Optional[SmartAlert]:
+    async def generate_korean_premarket_recommendations(self, predictions: List[GlobalPrediction],
+                                                        ctx: Optional[AlertContext] = None) -> Optional[SmartAlert]:
         """한국 프리마켓 추천 알림 생성 (08:30 - 장 시작 30분 전)"""
         print("🇰🇷 한국 프리마켓 추천 알림 생성 중...")
         
@@ -254,11 +452,11 @@ class SmartAlertSystem:
                 return None
             
             # 시장 체제 분석
-            market_condition = self.ml_engine.detect_market_regime()
+            market_condition = await self._cached_regime()
             
             # 제목 생성 (한국 시간대 명시)
-            kr_time_str = datetime.now(self.kr_timezone).strftime('%m/%d %H:%M KST')
-            title = f"🇰🇷 한국 주식 프리마켓 추천 ({kr_time_str})"
+            ctx = ctx or self.build_context()
+            title = f"🇰🇷 한국 주식 프리마켓 추천 ({ctx.kr_time_str})"
             
             # 메시지 구성
             message_lines = [
@@ -318,14 +516,15 @@ class SmartAlertSystem:
                 ])
             
             # 최종 메시지
-            message = "\n".join(message_lines)
+            parts: List[str] = ["\n".join(message_lines)]
             
             if recommendations:
-                message += "\n\n🎯 **투자 조언**\n"
-                message += "\n".join(f"• {rec}" for rec in recommendations)
+                parts.append("\n\n🎯 **투자 조언**\n")
+                parts.append("\n".join(f"• {rec}" for rec in recommendations))
             
             # 면책조항
-            message += "\n\n⚠️ *본 정보는 투자 참고용이며, 투자 결정은 본인 책임입니다.*"
+            parts.append("\n\n⚠️ *본 정보는 투자 참고용이며, 투자 결정은 본인 책임입니다.*")
+            message = "".join(parts)
             
             # 긴급도 결정
             urgency_level = "HIGH" if market_condition.risk_level in ["HIGH", "CRITICAL"] else "MEDIUM"
@@ -351,25 +550,29 @@ class SmartAlertSystem:
             print(f"   상세 오류: {traceback.format_exc()}")
             return None
     
-    def generate_bear_market_warning(self) -> Optional[SmartAlert]:
+    async def generate_bear_market_warning(self, ctx: Optional[AlertContext] = None) -> Optional[SmartAlert]:
         """하락장 경고 알림 생성"""
         print("🐻 하락장 경고 알림 검사 중...")
         
         try:
+            ctx = ctx or self.build_context()
+            
             # 시장 체제 분석
-            market_condition = self.ml_engine.detect_market_regime()
+            market_condition = await self._cached_regime()
             
             # 하락장이 아니면 알림 없음
             if market_condition.regime not in [MarketRegime.BEAR_MARKET, MarketRegime.CRISIS_MODE]:
                 return None
             
-            # 한국/미국 시장 모두 분석
-            kr_predictions = self.ml_engine.predict_stocks(MarketRegion.KR, top_n=10)
-            us_predictions = self.ml_engine.predict_stocks(MarketRegion.US, top_n=10)
+            # 한국/미국 시장 모두 분석 (같은 ML 엔진을 쓰므로 순서대로 조회)
+            kr_predictions = await self._cached_predictions(MarketRegion.KR, top_n=10)
+            us_predictions = await self._cached_predictions(MarketRegion.US, top_n=10)
             
             # 전반적인 부정적 전망 체크
-            kr_negative = sum(1 for p in kr_predictions if p.predicted_return < -2) / len(kr_predictions) if kr_predictions else 0
-            us_negative = sum(1 for p in us_predictions if p.predicted_return < -2) / len(us_predictions) if us_predictions else 0
+            kr_returns = _predicted_returns(kr_predictions)
+            us_returns = _predicted_returns(us_predictions)
+            kr_negative = float((kr_returns < -2).mean()) if kr_predictions else 0
+            us_negative = float((us_returns < -2).mean()) if us_predictions else 0
             
             overall_negative = (kr_negative + us_negative) / 2
             
@@ -378,42 +581,32 @@ class SmartAlertSystem:
                 return None
             
             # 경고 메시지 구성 (한국 시간대 명시)
-            kr_time_str = datetime.now(self.kr_timezone).strftime('%m/%d %H:%M KST')
-            title = f"🚨 하락장 경고 - 포지션 정리 권고 ({kr_time_str})"
+            title = f"🚨 하락장 경고 - 포지션 정리 권고 ({ctx.kr_time_str})"
             
             severity_level = "위험" if market_condition.regime == MarketRegime.BEAR_MARKET else "심각"
             
             # 시장 시간 정보 추가
-            market_schedule = self.market_time_manager.get_market_schedule_info()
-            current_status = self.market_time_manager.get_current_market_status()
-            
-            time_info = f"⏰ **현재 시장 상황**\n"
-            time_info += f"📅 {market_schedule['today_date']}\n"
-            time_info += f"🔄 현재 상태: {current_status['status']}\n"
-            
-            if current_status['status'] == '정규장':
-                time_info += f"⚠️ 현재 거래 시간 중입니다 - 즉시 대응 필요\n"
-            elif current_status['status'] == '프리마켓':
-                time_info += f"📈 프리마켓 시간 - 정규장 전 대응 준비\n"
-            elif current_status['status'] == '애프터마켓':
-                time_info += f"📉 애프터마켓 - 다음 거래일 대응 계획 수립\n"
-            else:
-                time_info += f"🛑 시장 마감 - 다음 거래일 대응 준비\n"
-            
-            time_info += f"• 다음 정규장: {market_schedule['regular']['us_time']} (미국) / {market_schedule['regular']['kr_time']} (한국)\n\n"
-            
-            message = f"⚠️ **{severity_level}한 시장 상황이 감지되었습니다**\n\n"
-            message += time_info
+            market_schedule = ctx.market_schedule
+            current_status = ctx.current_status
+            
+            parts: List[str] = [
+                f"⚠️ **{severity_level}한 시장 상황이 감지되었습니다**\n\n",
+                f"⏰ **현재 시장 상황**\n",
+                f"📅 {market_schedule['today_date']}\n",
+                f"🔄 현재 상태: {current_status['status']}\n",
+                _STATUS_ACTION.get(current_status['status'], _CLOSED_STATUS_ACTION),
+                f"• 다음 정규장: {market_schedule['regular']['us_time']} (미국) / {market_schedule['regular']['kr_time']} (한국)\n\n"
+            ]
             
-            message += f"📊 **시장 분석 결과**\n"
-            message += f"• 시장 체제: {market_condition.regime.value}\n"
-            message += f"• 변동성 수준: {market_condition.volatility_level:.1%}\n"
-            message += f"• 공포 지수: {market_condition.fear_greed_index:.0f}/100\n"
-            message += f"• 리스크 레벨: {market_condition.risk_level}\n\n"
+            parts.append(f"📊 **시장 분석 결과**\n")
+            parts.append(f"• 시장 체제: {market_condition.regime.value}\n")
+            parts.append(f"• 변동성 수준: {market_condition.volatility_level:.1%}\n")
+            parts.append(f"• 공포 지수: {market_condition.fear_greed_index:.0f}/100\n")
+            parts.append(f"• 리스크 레벨: {market_condition.risk_level}\n\n")
             
-            message += f"📈 **시장 전망**\n"
-            message += f"• 🇰🇷 한국 종목 부정적 비율: {kr_negative:.0%}\n"
-            message += f"• 🇺🇸 미국 종목 부정적 비율: {us_negative:.0%}\n\n"
+            parts.append(f"📈 **시장 전망**\n")
+            parts.append(f"• 🇰🇷 한국 종목 부정적 비율: {kr_negative:.0%}\n")
+            parts.append(f"• 🇺🇸 미국 종목 부정적 비율: {us_negative:.0%}\n\n")
             
             # 권고사항
             recommendations = []
@@ -433,18 +626,25 @@ class SmartAlertSystem:
                     "🎯 현금 확보로 향후 기회 대비"
                 ])
             
-            message += "🎯 **즉시 행동 권고**\n"
-            message += "\n".join(f"• {rec}" for rec in recommendations)
+            parts.append("🎯 **즉시 행동 권고**\n")
+            parts.append("\n".join(f"• {rec}" for rec in recommendations))
             
             # 가장 위험한 종목들 표시
             all_predictions = (kr_predictions + us_predictions)
-            risky_stocks = [p for p in all_predictions if p.predicted_return < -5][:5]
+            all_returns = np.concatenate([kr_returns, us_returns])
+            risky_idx = np.flatnonzero(all_returns < -5)
+            if len(risky_idx) > 5:
+                risky_idx = risky_idx[np.argpartition(all_returns[risky_idx], 5)[:5]]
+            risky_idx = risky_idx[np.argsort(all_returns[risky_idx], kind='stable')]
+            risky_stocks = [all_predictions[i] for i in risky_idx]
             
             if risky_stocks:
-                message += "\n\n📉 **주의 종목 (5% 이상 하락 예상)**\n"
+                parts.append("\n\n📉 **주의 종목 (5% 이상 하락 예상)**\n")
                 for stock in risky_stocks:
                     flag = "🇰🇷" if stock.market_region == "KR" else "🇺🇸"
-                    message += f"• {flag} {stock.stock_code}: {stock.predicted_return:+.1f}%\n"
+                    parts.append(f"• {flag} {stock.stock_code}: {stock.predicted_return:+.1f}%\n")
+            
+            message = "".join(parts)
             
             alert = SmartAlert(
                 alert_type=AlertType.BEAR_MARKET_WARNING,
@@ -465,71 +665,67 @@ class SmartAlertSystem:
             print(f"   ❌ 하락장 경고 생성 실패: {e}")
             return None
     
-    def generate_market_close_summary(self, region: MarketRegion) -> Optional[SmartAlert]:
+    async def generate_market_close_summary(self, region: MarketRegion,
+                                      ctx: Optional[AlertContext] = None) -> Optional[SmartAlert]:
         """장 마감 후 요약 알림 생성"""
         print(f"📊 {region.value} 장 마감 요약 생성 중...")
         
         try:
+            ctx = ctx or self.build_context()
+            
             # 해당 시장 예측 결과
-            predictions = self.ml_engine.predict_stocks(region, top_n=10)
+            predictions = await self._cached_predictions(region, top_n=10)
             
             if not predictions:
                 return None
             
             # 시장 요약 통계
+            returns = _predicted_returns(predictions)
             total_stocks = len(predictions)
-            positive_stocks = sum(1 for p in predictions if p.predicted_return > 0)
+            positive_stocks = int((returns > 0).sum())
             negative_stocks = total_stocks - positive_stocks
             
-            avg_return = sum(p.predicted_return for p in predictions) / total_stocks
-            max_return = max(predictions, key=lambda x: x.predicted_return)
-            min_return = min(predictions, key=lambda x: x.predicted_return)
+            avg_return = float(returns.mean())
+            max_return = predictions[int(returns.argmax())]
+            min_return = predictions[int(returns.argmin())]
             
             # 제목 및 시장 정보 (한국 시간대 명시)
             market_name = "한국" if region == MarketRegion.KR else "미국"
-            kr_time_str = datetime.now(self.kr_timezone).strftime('%m/%d %H:%M KST')
-            title = f"📊 {market_name} 시장 마감 후 분석 요약 ({kr_time_str})"
+            title = f"📊 {market_name} 시장 마감 후 분석 요약 ({ctx.kr_time_str})"
             
             # 내일 시장 시간 정보 (미국 시장용)
             time_info = ""
             if region == MarketRegion.US:
-                tomorrow_schedule = self.market_time_manager.get_market_schedule_info(days_offset=1)
-                dst_status = self.market_time_manager.format_dst_status()
+                tomorrow_schedule = ctx.tomorrow_schedule
+                dst_status = ctx.dst_status
                 
-                time_info = f"🕐 **내일 미국 시장 운영 시간**\n"
-                time_info += f"📅 {tomorrow_schedule['today_date']}\n"
-                time_info += f"🌍 {dst_status}\n"
-                time_info += f"• 프리마켓: {tomorrow_schedule['premarket']['us_time']} (현지) / {tomorrow_schedule['premarket']['kr_time']} (한국)\n"
-                time_info += f"• 정규장: {tomorrow_schedule['regular']['us_time']} (현지) / {tomorrow_schedule['regular']['kr_time']} (한국)\n"
-                time_info += f"• 애프터마켓: {tomorrow_schedule['aftermarket']['us_time']} (현지) / {tomorrow_schedule['aftermarket']['kr_time']} (한국)\n\n"
+                time_info = _format_us_schedule("내일", tomorrow_schedule, dst_status)
             elif region == MarketRegion.KR:
                 # 한국 시장은 고정 시간이므로 간단히 표시
-                time_info = f"🕐 **내일 한국 시장 운영 시간**\n"
-                time_info += f"• 정규장: 09:00 - 15:30 (한국시간)\n"
-                time_info += f"• 동시호가: 08:30 - 09:00, 15:30 - 16:00\n\n"
+                time_info = _KR_SCHEDULE_INFO
             
             # 메시지 구성
-            message = f"🏁 **{market_name} 시장 분석 완료**\n\n"
+            parts: List[str] = [f"🏁 **{market_name} 시장 분석 완료**\n\n"]
             
             if time_info:
-                message += time_info
+                parts.append(time_info)
             
-            message += f"📈 **시장 전망 요약**\n"
-            message += f"• 전체 분석 종목: {total_stocks}개\n"
-            message += f"• 상승 예상: {positive_stocks}개 ({positive_stocks/total_stocks:.0%})\n"
-            message += f"• 하락 예상: {negative_stocks}개 ({negative_stocks/total_stocks:.0%})\n"
-            message += f"• 평균 예상 수익률: {avg_return:+.1f}%\n\n"
+            parts.append(f"📈 **시장 전망 요약**\n")
+            parts.append(f"• 전체 분석 종목: {total_stocks}개\n")
+            parts.append(f"• 상승 예상: {positive_stocks}개 ({positive_stocks/total_stocks:.0%})\n")
+            parts.append(f"• 하락 예상: {negative_stocks}개 ({negative_stocks/total_stocks:.0%})\n")
+            parts.append(f"• 평균 예상 수익률: {avg_return:+.1f}%\n\n")
             
-            message += f"🎯 **주목 종목**\n"
-            message += f"🔝 최고 기대: {max_return.stock_code} ({max_return.predicted_return:+.1f}%)\n"
-            message += f"⚠️ 최대 리스크: {min_return.stock_code} ({min_return.predicted_return:+.1f}%)\n\n"
+            parts.append(f"🎯 **주목 종목**\n")
+            parts.append(f"🔝 최고 기대: {max_return.stock_code} ({max_return.predicted_return:+.1f}%)\n")
+            parts.append(f"⚠️ 최대 리스크: {min_return.stock_code} ({min_return.predicted_return:+.1f}%)\n\n")
             
             # 상위 3개 추천
             top_3 = predictions[:3]
-            message += f"🏆 **내일 상위 3개 추천**\n"
+            parts.append(f"🏆 **내일 상위 3개 추천**\n")
             for i, pred in enumerate(top_3, 1):
-                rec_emoji = {"STRONG_BUY": "🚀", "BUY": "📈"}.get(pred.recommendation, "📊")
-                message += f"{i}. {rec_emoji} {pred.stock_code}: {pred.predicted_return:+.1f}% ({pred.recommendation})\n"
+                rec_emoji = _CLOSE_REC_EMOJI.get(pred.recommendation, "📊")
+                parts.append(f"{i}. {rec_emoji} {pred.stock_code}: {pred.predicted_return:+.1f}% ({pred.recommendation})\n")
             
             # 시장 조건에 따른 조언
             market_condition = self.ml_engine.market_condition
@@ -547,8 +743,10 @@ class SmartAlertSystem:
                     recommendations.append("📉 조정 가능성, 현금 비중 확대 고려")
             
             if recommendations:
-                message += "\n🎯 **내일 투자 전략**\n"
-                message += "\n".join(f"• {rec}" for rec in recommendations)
+                parts.append("\n🎯 **내일 투자 전략**\n")
+                parts.append("\n".join(f"• {rec}" for rec in recommendations))
+            
+            message = "".join(parts)
             
             alert = SmartAlert(
                 alert_type=AlertType.MARKET_REGIME_CHANGE,
@@ -579,9 +777,20 @@ class SmartAlertSystem:
         
         try:
             # Discord와 Telegram 동시 전송
-            discord_success = await self._send_discord_message(alert)
-            telegram_success = await self._send_telegram_message(alert)
-            
+            discord_success, telegram_success = await asyncio.gather(
+                self._send_discord_message(alert),
+                self._send_telegram_message(alert),
+                return_exceptions=True
+            )
+
+            # 예외는 전송 실패로 처리
+            if isinstance(discord_success, BaseException):
+                print(f"   ❌ Discord 전송 에러: {discord_success}")
+                discord_success = False
+            if isinstance(telegram_success, BaseException):
+                print(f"   ❌ Telegram 전송 에러: {telegram_success}")
+                telegram_success = False
+
             success_count = 0
             if discord_success:
                 print(f"   ✅ Discord 전송 성공")
@@ -598,7 +807,7 @@ class SmartAlertSystem:
             # 하나라도 성공하면 성공으로 처리
             if success_count > 0:
                 # 전송 기록 저장
-                self.last_alerts[alert.alert_type.value] = datetime.now()
+                self._mark_sent(alert.alert_type, monotonic())
                 print(f"   📊 알림 전송 완료: {success_count}/2 플랫폼")
                 return True
             else:
@@ -612,8 +821,9 @@ class SmartAlertSystem:
     async def _send_discord_message(self, alert: SmartAlert) -> bool:
         """Discord 메시지 전송"""
         try:
-            # 기존 notification 서비스의 Discord 기능 활용
-            from discord_webhook import DiscordWebhook, DiscordEmbed
+            if DiscordWebhook is None:
+                print("   ⚠️ discord_webhook 패키지가 설치되지 않음")
+                return False
             
             if not settings.discord_webhook_url:
                 print("   ⚠️ Discord webhook URL 설정되지 않음")
@@ -624,23 +834,13 @@ class SmartAlertSystem:
             # Embed 생성
             embed = DiscordEmbed(
                 title=alert.title,
-                description=alert.message[:2000],  # Discord 제한
+                description=alert.short_message,  # Discord 제한
                 color=self._get_alert_color(alert.urgency_level)
             )
             
             # 추가 정보
-            embed.add_embed_field(
-                name="긴급도",
-                value=alert.urgency_level,
-                inline=True
-            )
-            
-            embed.add_embed_field(
-                name="시장",
-                value=alert.market_region,
-                inline=True
-            )
-            
+            embed.add_embed_field(name="긴급도", value=alert.urgency_level, inline=True)
+            embed.add_embed_field(name="시장", value=alert.market_region, inline=True)
             embed.add_embed_field(
                 name="시간",
                 value=alert.created_at.strftime("%Y-%m-%d %H:%M"),
@@ -648,8 +848,13 @@ class SmartAlertSystem:
             )
             
             webhook.add_embed(embed)
-            response = webhook.execute()
             
+            # webhook 페이로드를 공유 비동기 HTTP 클라이언트로 전송
+            response = await self._get_http().post(
+                webhook.url,
+                json=webhook.json,
+                params={"wait": "true"}
+            )
             return response.status_code == 200
             
         except Exception as e:
@@ -659,38 +864,19 @@ class SmartAlertSystem:
     async def _send_telegram_message(self, alert: SmartAlert) -> bool:
         """Telegram 메시지 전송"""
         try:
-            import requests
-            
             # Telegram 설정 확인
             if not settings.telegram_bot_token or not settings.telegram_chat_id:
                 print("   ⚠️ Telegram 설정이 완료되지 않음")
                 return False
             
-            # 메시지 포맷팅 (Telegram Markdown 지원)
-            message = f"""
-🚨 **{alert.title}**
-
-**긴급도:** {alert.urgency_level}
-**시장:** {alert.market_region}
-**시간:** {alert.created_at.strftime("%Y-%m-%d %H:%M")}
-
-{alert.message}
-"""
-            
-            # 추천사항이 있다면 추가
-            if alert.recommendations:
-                message += "\n\n**📋 권장사항:**\n"
-                for i, rec in enumerate(alert.recommendations, 1):
-                    message += f"{i}. {rec}\n"
-            
-            # Telegram API 호출 (Markdown 파싱 제거)
+            # Telegram API 호출 (헤더/권장사항까지 붙인 최종 메시지를 길이 제한에 맞춤)
             url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
             payload = {
                 "chat_id": settings.telegram_chat_id,
-                "text": message.replace("**", "").replace("*", "")  # Markdown 문법 제거
+                "text": truncate_message(self._format_telegram_text(alert))
             }
             
-            response = requests.post(url, json=payload, timeout=10)
+            response = await self._get_http().post(url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 return True
@@ -702,66 +888,115 @@ class SmartAlertSystem:
             print(f"   ❌ Telegram 전송 에러: {e}")
             return False
     
+    def _format_telegram_text(self, alert: SmartAlert) -> str:
+        """Telegram 메시지 포맷팅 (Markdown 문법 제거)"""
+        message = f"""
+🚨 **{alert.title}**
+
+**긴급도:** {alert.urgency_level}
+**시장:** {alert.market_region}
+**시간:** {alert.created_at.strftime("%Y-%m-%d %H:%M")}
+
+{alert.message}
+"""
+        parts = [message]
+        
+        # 추천사항이 있다면 추가
+        if alert.recommendations:
+            parts.append("\n\n**📋 권장사항:**\n")
+            parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(alert.recommendations, 1))
+        
+        return "".join(parts).replace("**", "").replace("*", "")
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """연결 재사용을 위한 공유 HTTP 클라이언트"""
+        loop = asyncio.get_running_loop()
+        # 작업마다 asyncio.run 으로 새 루프가 뜨므로 이전 루프의 연결은 재사용 불가
+        if self._http is None or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=20, keepalive_expiry=60),
+                timeout=10
+            )
+            self._http_loop = loop
+        return self._http
+    
+    async def aclose(self):
+        """공유 HTTP 클라이언트 정리 (클라이언트를 만든 이벤트 루프가 끝나기 전에 호출)"""
+        if self._http is not None and self._http_loop is asyncio.get_running_loop():
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
+    
     def _get_alert_color(self, urgency_level: str) -> int:
         """긴급도별 색상 코드"""
-        colors = {
-            "LOW": 0x00FF00,      # 초록
-            "MEDIUM": 0xFFFF00,   # 노랑  
-            "HIGH": 0xFF8C00,     # 주황
-            "CRITICAL": 0xFF0000  # 빨강
-        }
-        return colors.get(urgency_level, 0x808080)
-    
-    def should_send_alert(self, alert_type: AlertType, cooldown_hours: int = 1) -> bool:
+        return _ALERT_COLORS.get(urgency_level, 0x808080)
+    
+    def should_send_alert(self, alert_type: AlertType) -> bool:
         """알림 쿨다운 체크"""
-        if alert_type.value not in self.last_alerts:
-            return True
-        
-        last_sent = self.last_alerts[alert_type.value]
-        cooldown_period = timedelta(hours=cooldown_hours)
-        
-        return datetime.now() - last_sent > cooldown_period
+        return monotonic() >= self._next_eligible.get(alert_type, 0.0)
+    
+    def _mark_sent(self, alert_type: AlertType, now: float):
+        """전송 성공 시 유형별 쿨다운 시작"""
+        cooldown_hours = ALERT_COOLDOWN_HOURS.get(alert_type, DEFAULT_ALERT_COOLDOWN_HOURS)
+        self._next_eligible[alert_type] = now + cooldown_hours * 3600.0
+    
+    def _claim_alert(self, alert_type: AlertType) -> bool:
+        """쿨다운이 지났으면 바로 다음 전송 가능 시각을 예약 (판정과 기록 사이에 await 없음)"""
+        now = monotonic()
+        if now < self._next_eligible.get(alert_type, 0.0):
+            return False
+        self._mark_sent(alert_type, now)
+        return True
+    
+    async def _send_generated(self, alert_coro, claimed: Optional[AlertType] = None) -> int:
+        """알림 생성 후 전송 (전송 성공 시 1 반환, 실패 시 예약한 쿨다운 해제)"""
+        sent = False
+        try:
+            alert = await alert_coro
+            sent = bool(alert) and await self.send_alert(alert)
+        finally:
+            if claimed is not None and not sent:
+                self._next_eligible.pop(claimed, None)
+        return int(sent)
     
     async def run_alert_cycle(self):
         """알림 주기 실행"""
         print("🔄 스마트 알림 시스템 실행 중...")
         
-        alerts_sent = 0
-        
         try:
+            # 이번 주기의 시장 시간 정보는 모든 알림에서 공유
+            ctx = self.build_context()
+            
+            # 쿨다운은 판정과 동시에 예약해 겹치는 주기에서 같은 알림이 두 번 나가지 않도록 함
+            jobs = []
+            
             # 1. 프리마켓 알림 체크 (미국)
             if self.should_send_premarket_alert():
-                if self.should_send_alert(AlertType.PREMARKET_RECOMMENDATIONS, cooldown_hours=6):
-                    premarket_alert = self.generate_premarket_alert()
-                    if premarket_alert:
-                        success = await self.send_alert(premarket_alert)
-                        if success:
-                            alerts_sent += 1
+                if self._claim_alert(AlertType.PREMARKET_RECOMMENDATIONS):
+                    jobs.append(self._send_generated(self.generate_premarket_alert(ctx),
+                                                     AlertType.PREMARKET_RECOMMENDATIONS))
             
             # 2. 하락장 경고 체크
-            if self.should_send_alert(AlertType.BEAR_MARKET_WARNING, cooldown_hours=4):
-                bear_warning = self.generate_bear_market_warning()
-                if bear_warning:
-                    success = await self.send_alert(bear_warning)
-                    if success:
-                        alerts_sent += 1
+            if self._claim_alert(AlertType.BEAR_MARKET_WARNING):
+                jobs.append(self._send_generated(self.generate_bear_market_warning(ctx),
+                                                 AlertType.BEAR_MARKET_WARNING))
             
             # 3. 한국 시장 마감 요약
             if self.should_send_market_close_alert(MarketRegion.KR):
-                if self.should_send_alert(AlertType.MARKET_REGIME_CHANGE, cooldown_hours=8):
-                    kr_summary = self.generate_market_close_summary(MarketRegion.KR)
-                    if kr_summary:
-                        success = await self.send_alert(kr_summary)
-                        if success:
-                            alerts_sent += 1
+                if self._claim_alert(AlertType.MARKET_REGIME_CHANGE):
+                    jobs.append(self._send_generated(self.generate_market_close_summary(MarketRegion.KR, ctx),
+                                                     AlertType.MARKET_REGIME_CHANGE))
             
             # 4. 미국 시장 마감 요약 (한국 시간 새벽)
             if self.should_send_market_close_alert(MarketRegion.US):
-                us_summary = self.generate_market_close_summary(MarketRegion.US)
-                if us_summary:
-                    success = await self.send_alert(us_summary)
-                    if success:
-                        alerts_sent += 1
+                jobs.append(self._send_generated(self.generate_market_close_summary(MarketRegion.US, ctx)))
+            
+            # 서로 독립적인 알림은 동시에 생성/전송 (한 작업의 실패가 다른 작업을 막지 않음)
+            results = await asyncio.gather(*jobs, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"   ❌ 알림 작업 실패: {result}")
+            alerts_sent = sum(r for r in results if isinstance(r, int))
             
             print(f"📊 알림 주기 완료: {alerts_sent}개 전송")
             return alerts_sent > 0
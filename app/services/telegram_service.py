@@ -3,235 +3,542 @@
 실시간 주식 분석 결과를 텔레그램으로 전송
 """
 import asyncio
+import functools
+import hashlib
+import importlib.util
 import logging
+import threading
+from collections import OrderedDict
+from time import monotonic, sleep
 from typing import Optional, Dict, Any
 from datetime import datetime
-import requests
-from pathlib import Path
-import os
-import sys
-
-# 프로젝트 루트 경로 추가
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.append(str(PROJECT_ROOT))
+import httpx
 
+# orjson 이 설치되어 있으면 JSON 직렬화/파싱에 사용
 try:
-    from app.config.settings import settings
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
 except ImportError:
-    # 개발 환경에서 설정이 없을 경우 기본값 사용
-    class MockSettings:
-        telegram_enabled = False
-        telegram_bot_token = ""
-        telegram_chat_id = ""
-    settings = MockSettings()
+    import json
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+
+class _MockSettings:
+    """개발 환경에서 설정이 없을 경우 사용할 기본값"""
+    telegram_enabled = False
+    telegram_bot_token = ""
+    telegram_chat_id = ""
+
+
+@functools.cache
+def _settings():
+    """애플리케이션 설정 (최초 사용 시 한 번만 로드)"""
+    try:
+        from app.config.settings import settings
+        return settings
+    except ImportError:
+        return _MockSettings()
 
 logger = logging.getLogger(__name__)
 
+# 429(전송 한도 초과) 응답 시 최대 재시도 횟수
+MAX_SEND_RETRIES = 5
+
+# api.telegram.org 연결 풀 (keep-alive 연결 재사용)
+# h2 패키지가 있으면 HTTP/2 로 한 연결에서 동시 요청을 다중화
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_HTTP2 = importlib.util.find_spec("h2") is not None
+if TELEGRAM_HTTP2:
+    TELEGRAM_POOL_LIMITS = httpx.Limits(max_connections=2, max_keepalive_connections=1, keepalive_expiry=75)
+else:
+    TELEGRAM_POOL_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=75)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# sendMessage 본문 최대 길이 (UTF-16 코드 단위) 및 초과 시 잘린 메시지 끝에 붙이는 표시
+TELEGRAM_MAX_LENGTH = 4096
+TRUNCATION_SUFFIX = "\n…(생략)"
+
+# 동일 메시지 중복 전송 억제 구간 (초) 및 기억할 최대 메시지 수
+DEDUP_WINDOW = 300
+DEDUP_MAX_ENTRIES = 1024
+
+# 메시지 장식용 조회 테이블
+_SIGNAL_EMOJI = {
+    'BUY': '🟢',
+    'SELL': '🔴',
+    'HOLD': '🟡'
+}
+_STATUS_EMOJI = {
+    'OPEN': '🟢',
+    'CLOSED': '🔴',
+    'PRE_MARKET': '🟡',
+    'AFTER_HOURS': '🟠'
+}
+_MARKET_NAME = {'KR': '🇰🇷 한국', 'US': '🇺🇸 미국'}
+# 등락 부호(-1, 0, 1) + 1 로 조회
+_CHANGE_EMOJI = ('📉', '➡️', '📈')
+
+# 메시지 템플릿 (format_map 으로 채움)
+_STOCK_TMPL = (
+    "{signal_emoji} *주식 알림* {signal_emoji}\n\n"
+    "📊 *종목*: {name} ({symbol})\n"
+    "💰 *현재가*: {price:,.0f}원\n"
+    "{change_emoji} *변동률*: {change:+.2f}%\n"
+    "🎯 *신호*: {signal}\n"
+    "🔍 *신뢰도*: {confidence:.1%}\n\n"
+    "⏰ {ts}"
+)
+_SUMMARY_TMPL = (
+    "📊 *일일 주식 분석 요약* 📊\n\n"
+    "📅 *날짜*: {date}\n"
+    "🔍 *분석 종목*: {total_stocks}개\n"
+    "🟢 *매수 신호*: {buy_signals}개\n"
+    "🔴 *매도 신호*: {sell_signals}개\n"
+    "🎯 *평균 정확도*: {avg_accuracy:.1%}\n\n"
+    "🏆 *오늘의 추천 종목*:"
+)
+_SUMMARY_PICK_TMPL = "{rank}. {name} (기대수익률: {expected_return:+.1%}, 신뢰도: {confidence:.1%})"
+_MARKET_TMPL = (
+    "{status_emoji} *{market_name} 시장 현황* {status_emoji}\n\n"
+    "📊 *상태*: {status}"
+)
+_MARKET_INDEX_TMPL = "{change_emoji} *{index_name}*: {value:,.2f} ({change:+.2f}%)"
+_ERROR_TMPL = (
+    "🚨 *시스템 오류 알림* 🚨\n\n"
+    "🔧 *컴포넌트*: {component}\n"
+    "⚠️ *오류 유형*: {error_type}\n"
+    "📝 *메시지*: {message}\n\n"
+    "⏰ {ts}\n\n"
+    "관리자 확인이 필요합니다."
+)
+_FOOTER_TMPL = "\n\n⏰ {ts}"
+
+
+def _now_str() -> str:
+    """현재 시각 문자열 (YYYY-MM-DD HH:MM:SS)"""
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+
+def _format_stock_alert(stock_info: Dict[str, Any]) -> Optional[str]:
+    """주식 알림 메시지 (생성 실패 시 None)"""
+    try:
+        symbol = stock_info.get('symbol', 'Unknown')
+        change = stock_info.get('change_percent', 0)
+        signal = stock_info.get('signal', 'HOLD')
+        
+        return _STOCK_TMPL.format_map({
+            'signal_emoji': _SIGNAL_EMOJI.get(signal, '⚪'),
+            'name': stock_info.get('name', symbol),
+            'symbol': symbol,
+            'price': stock_info.get('current_price', 0),
+            'change_emoji': _CHANGE_EMOJI[(change > 0) - (change < 0) + 1],
+            'change': change,
+            'signal': signal,
+            'confidence': stock_info.get('confidence', 0),
+            'ts': _now_str()
+        })
+    
+    except Exception as e:
+        logger.error(f"주식 알림 생성 중 오류: {e}")
+        return None
+
+
+def _format_daily_summary(summary_data: Dict[str, Any]) -> Optional[str]:
+    """일일 요약 리포트 메시지 (생성 실패 시 None)"""
+    try:
+        ts = _now_str()
+        
+        lines = [_SUMMARY_TMPL.format_map({
+            'date': summary_data.get('date', ts[:10]),
+            'total_stocks': summary_data.get('total_stocks', 0),
+            'buy_signals': summary_data.get('buy_signals', 0),
+            'sell_signals': summary_data.get('sell_signals', 0),
+            'avg_accuracy': summary_data.get('avg_accuracy', 0)
+        })]
+        
+        for i, stock in enumerate(summary_data.get('top_picks', [])[:5], 1):
+            lines.append(_SUMMARY_PICK_TMPL.format_map({
+                'rank': i,
+                'name': stock.get('name', stock.get('symbol', 'Unknown')),
+                'expected_return': stock.get('expected_return', 0),
+                'confidence': stock.get('confidence', 0)
+            }))
+        
+        return "\n".join(lines) + _FOOTER_TMPL.format(ts=ts)
+    
+    except Exception as e:
+        logger.error(f"일일 요약 생성 중 오류: {e}")
+        return None
+
+
+def _format_market_status(market_data: Dict[str, Any]) -> Optional[str]:
+    """시장 현황 메시지 (생성 실패 시 None)"""
+    try:
+        market = market_data.get('market', 'KR')
+        status = market_data.get('status', 'UNKNOWN')
+        
+        lines = [_MARKET_TMPL.format_map({
+            'status_emoji': _STATUS_EMOJI.get(status, '⚪'),
+            'market_name': _MARKET_NAME.get(market, market),
+            'status': status
+        })]
+        
+        # 주요 지수 정보 추가
+        for index_name, index_data in market_data.get('indices', {}).items():
+            change = index_data.get('change_percent', 0)
+            lines.append(_MARKET_INDEX_TMPL.format_map({
+                'change_emoji': _CHANGE_EMOJI[(change > 0) - (change < 0) + 1],
+                'index_name': index_name,
+                'value': index_data.get('value', 0),
+                'change': change
+            }))
+        
+        return "\n".join(lines) + _FOOTER_TMPL.format(ts=_now_str())
+    
+    except Exception as e:
+        logger.error(f"시장 현황 생성 중 오류: {e}")
+        return None
+
+
+def _format_error_alert(error_info: Dict[str, Any]) -> Optional[str]:
+    """시스템 오류 알림 메시지 (생성 실패 시 None)"""
+    try:
+        return _ERROR_TMPL.format_map({
+            'component': error_info.get('component', 'Unknown'),
+            'error_type': error_info.get('error_type', 'Error'),
+            'message': error_info.get('message', 'Unknown error'),
+            'ts': _now_str()
+        })
+    
+    except Exception as e:
+        logger.error(f"오류 알림 생성 중 오류: {e}")
+        return None
+
+
+def _error_dedup_key(error_info: Dict[str, Any]) -> str:
+    """같은 컴포넌트의 같은 유형 오류는 메시지 내용과 무관하게 한 번만 전송"""
+    return f"error_alert:{error_info.get('component', 'Unknown')}:{error_info.get('error_type', 'Error')}"
+
+
+def _telegram_length(text: str) -> int:
+    """Telegram 이 세는 메시지 길이 (이모지 등 BMP 밖 문자는 2로 계산)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def truncate_message(text: str, limit: int = TELEGRAM_MAX_LENGTH) -> str:
+    """길이 제한을 넘는 메시지를 잘라 TRUNCATION_SUFFIX 를 붙임 (제한 이내면 그대로 반환)"""
+    # 한 문자는 최대 2 코드 단위이므로 짧은 메시지는 인코딩 없이 통과
+    if len(text) * 2 <= limit or _telegram_length(text) <= limit:
+        return text
+    keep = (limit - _telegram_length(TRUNCATION_SUFFIX)) * 2
+    # 서로게이트 쌍 중간에서 잘린 경우 남은 반쪽은 버림
+    return text.encode('utf-16-le')[:keep].decode('utf-16-le', errors='ignore') + TRUNCATION_SUFFIX
+
+
 class TelegramNotifier:
     """텔레그램 알림 발송 클래스"""
     
     def __init__(self):
-        self.enabled = getattr(settings, 'telegram_enabled', False)
-        self.bot_token = getattr(settings, 'telegram_bot_token', '')
-        self.chat_id = getattr(settings, 'telegram_chat_id', '')
-        self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        s = _settings()
+        self.enabled = s.telegram_enabled
+        self.bot_token = s.telegram_bot_token
+        self.chat_id = s.telegram_chat_id
+        
+        # API 경로 (공유 클라이언트의 base_url 기준 상대 경로)
+        self._url_send_message = f"/bot{self.bot_token}/sendMessage"
+        
+        # 공유 HTTP 클라이언트 (최초 전송 시 생성, 이벤트 루프 단위로 재사용)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # 동기 send_* 용 공유 HTTP 클라이언트 (최초 동기 전송 시 생성)
+        self._sync_client: Optional[httpx.Client] = None
+        self._sync_client_lock = threading.Lock()
+        
+        # 최근 전송 메시지 해시 -> 전송 시각 (monotonic), 동기/비동기 호출이 여러 스레드에서 공유
+        self._recent_hashes: "OrderedDict[str, float]" = OrderedDict()
+        self._dedup_lock = threading.Lock()
+        self.deduped_count = 0
         
         if self.enabled and not self.bot_token:
             logger.warning("텔레그램이 활성화되었지만 봇 토큰이 설정되지 않았습니다")
             self.enabled = False
     
-    def send_message(self, message: str, parse_mode: str = "Markdown") -> bool:
+    @staticmethod
+    def _new_client() -> httpx.AsyncClient:
+        """api.telegram.org 용 비동기 HTTP 클라이언트 생성"""
+        return httpx.AsyncClient(
+            base_url=TELEGRAM_API_URL,
+            http2=TELEGRAM_HTTP2,
+            limits=TELEGRAM_POOL_LIMITS,
+            timeout=10
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """연결 재사용을 위한 HTTP 클라이언트 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self._new_client()
+            self._client_loop = loop
+        return self._client
+    
+    def _get_sync_client(self) -> httpx.Client:
+        """동기 send_* 용 공유 HTTP 클라이언트 (여러 스레드에서 함께 사용)"""
+        with self._sync_client_lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(
+                    base_url=TELEGRAM_API_URL,
+                    http2=TELEGRAM_HTTP2,
+                    limits=TELEGRAM_POOL_LIMITS,
+                    timeout=10
+                )
+            return self._sync_client
+    
+    async def aclose(self):
+        """HTTP 클라이언트 정리"""
+        logger.info(f"텔레그램 알림 종료 - 버퍼 상태: {self.stats()}")
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+    
+    def close(self):
+        """동기 send_* 용 HTTP 클라이언트 정리"""
+        with self._sync_client_lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+            self._sync_client = None
+    
+    def stats(self) -> Dict[str, int]:
+        """내부 버퍼 크기 (장기 실행 시 메모리 증가 확인용)"""
+        return {
+            'recent_hashes': len(self._recent_hashes),
+            'deduped_count': self.deduped_count
+        }
+    
+    def _claim_dedup(self, key: str) -> Optional[str]:
+        """
+        DEDUP_WINDOW 안에 같은 키의 메시지를 보냈거나 전송 중이면 None,
+        아니면 이번 전송을 선점 기록하고 해시 반환 (전송 실패 시 _release_dedup 으로 해제)
+        """
+        h = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        now = monotonic()
+        
+        with self._dedup_lock:
+            # 기록은 시간순으로 쌓이므로 앞에서부터 만료된 항목 정리
+            while self._recent_hashes:
+                oldest_key, oldest_at = next(iter(self._recent_hashes.items()))
+                if now - oldest_at < DEDUP_WINDOW:
+                    break
+                del self._recent_hashes[oldest_key]
+            
+            sent_at = self._recent_hashes.get(h)
+            if sent_at is not None and now - sent_at < DEDUP_WINDOW:
+                self.deduped_count += 1
+                return None
+            
+            self._recent_hashes[h] = now
+            self._recent_hashes.move_to_end(h)
+            if len(self._recent_hashes) > DEDUP_MAX_ENTRIES:
+                self._recent_hashes.popitem(last=False)
+            return h
+    
+    def _release_dedup(self, h: Optional[str]):
+        """보내지 못한 메시지의 중복 기록을 지워 재시도가 생략되지 않게 함"""
+        if h is not None:
+            with self._dedup_lock:
+                self._recent_hashes.pop(h, None)
+    
+    def _payload(self, message: str, parse_mode: str) -> Dict[str, Any]:
+        """sendMessage 요청 본문"""
+        return {
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': parse_mode
+        }
+    
+    def send_message(self, message: str, parse_mode: str = "Markdown",
+                     dedup_key: Optional[str] = None) -> bool:
+        """
+        텔레그램 메시지 전송 (동기 호출용, 호출 스레드를 막으므로 코루틴 안에서는 asend_message 사용)
+        
+        인자와 반환값은 asend_message 와 같음
+        """
+        if not self.enabled:
+            return False
+        
+        dedup_hash = self._claim_dedup(dedup_key or message)
+        if dedup_hash is None:
+            logger.info("텔레그램 중복 메시지 생략")
+            return True
+        
+        sent = False
+        try:
+            sent = self._post_message_sync(self._payload(message, parse_mode))
+            if sent:
+                logger.info("텔레그램 메시지 전송 성공")
+            return sent
+        
+        except Exception as e:
+            logger.error(f"텔레그램 메시지 전송 중 오류: {e}")
+            return False
+        finally:
+            if not sent:
+                self._release_dedup(dedup_hash)
+    
+    async def asend_message(self, message: str, parse_mode: str = "Markdown",
+                            dedup_key: Optional[str] = None) -> bool:
         """
         텔레그램 메시지 전송
         
         Args:
             message: 전송할 메시지
             parse_mode: 메시지 파싱 모드 (Markdown, HTML)
+            dedup_key: 중복 판정 키 (기본값: 메시지 본문)
             
         Returns:
-            성공 여부
+            성공 여부 (중복으로 생략된 경우도 True)
+        
+        TELEGRAM_MAX_LENGTH 를 넘는 메시지는 잘라서 보냄 (truncate_message)
         """
         if not self.enabled:
             return False
-            
+        
+        dedup_hash = self._claim_dedup(dedup_key or message)
+        if dedup_hash is None:
+            logger.info("텔레그램 중복 메시지 생략")
+            return True
+        
+        sent = False
         try:
-            url = f"{self.base_url}/sendMessage"
-            payload = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': parse_mode
-            }
-            
-            response = requests.post(url, data=payload, timeout=10)
-            result = response.json()
-            
-            if result.get('ok'):
+            sent = await self._post_message(self._payload(message, parse_mode))
+            if sent:
                 logger.info("텔레그램 메시지 전송 성공")
-                return True
-            else:
-                logger.error(f"텔레그램 메시지 전송 실패: {result.get('description')}")
-                return False
+            return sent
                 
         except Exception as e:
             logger.error(f"텔레그램 메시지 전송 중 오류: {e}")
             return False
+        finally:
+            if not sent:
+                self._release_dedup(dedup_hash)
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, result: Dict[str, Any], attempt: int) -> Optional[float]:
+        """실패한 sendMessage 응답의 재시도 대기 시간 (429 가 아니면 재시도하지 않고 None)"""
+        if response.status_code != 429:
+            logger.error(f"텔레그램 메시지 전송 실패: {result.get('description')}")
+            return None
+        
+        retry_after = result.get('parameters', {}).get('retry_after', 1)
+        delay = max(retry_after, 2 ** attempt)
+        logger.warning(f"텔레그램 전송 한도 초과 - {delay}초 후 재시도 ({attempt + 1}/{MAX_SEND_RETRIES})")
+        return delay
+    
+    async def _post_message(self, payload: Dict[str, Any]) -> bool:
+        """sendMessage 호출 (429 응답 시 retry_after 이상 대기 후 재시도)"""
+        payload['text'] = truncate_message(payload['text'])
+        for attempt in range(MAX_SEND_RETRIES):
+            response = await self._get_client().post(self._url_send_message, content=_dumps(payload), headers=_JSON_HEADERS)
+            result = _loads(response.content)
+            
+            if result.get('ok'):
+                return True
+            
+            delay = self._retry_delay(response, result, attempt)
+            if delay is None:
+                return False
+            await asyncio.sleep(delay)
+        
+        logger.error("텔레그램 메시지 전송 실패: 재시도 횟수 초과")
+        return False
+    
+    def _post_message_sync(self, payload: Dict[str, Any]) -> bool:
+        """_post_message 의 동기 버전 (공유 동기 클라이언트 사용)"""
+        payload['text'] = truncate_message(payload['text'])
+        for attempt in range(MAX_SEND_RETRIES):
+            response = self._get_sync_client().post(self._url_send_message, content=_dumps(payload), headers=_JSON_HEADERS)
+            result = _loads(response.content)
+            
+            if result.get('ok'):
+                return True
+            
+            delay = self._retry_delay(response, result, attempt)
+            if delay is None:
+                return False
+            sleep(delay)
+        
+        logger.error("텔레그램 메시지 전송 실패: 재시도 횟수 초과")
+        return False
     
     def send_stock_alert(self, stock_info: Dict[str, Any]) -> bool:
+        """주식 알림 메시지 전송 (동기 호출용, 코루틴 안에서는 asend_stock_alert 사용)"""
+        message = _format_stock_alert(stock_info)
+        return message is not None and self.send_message(message)
+    
+    async def asend_stock_alert(self, stock_info: Dict[str, Any]) -> bool:
         """
         주식 알림 메시지 전송
         
         Args:
             stock_info: 주식 정보 딕셔너리
         """
-        try:
-            symbol = stock_info.get('symbol', 'Unknown')
-            name = stock_info.get('name', symbol)
-            price = stock_info.get('current_price', 0)
-            change = stock_info.get('change_percent', 0)
-            signal = stock_info.get('signal', 'HOLD')
-            confidence = stock_info.get('confidence', 0)
-            
-            # 이모지 설정
-            signal_emoji = {
-                'BUY': '🟢',
-                'SELL': '🔴', 
-                'HOLD': '🟡'
-            }.get(signal, '⚪')
-            
-            change_emoji = '📈' if change > 0 else '📉' if change < 0 else '➡️'
-            
-            message = f"""
-{signal_emoji} *주식 알림* {signal_emoji}
-
-📊 *종목*: {name} ({symbol})
-💰 *현재가*: {price:,.0f}원
-{change_emoji} *변동률*: {change:+.2f}%
-🎯 *신호*: {signal}
-🔍 *신뢰도*: {confidence:.1%}
-
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            """.strip()
-            
-            return self.send_message(message)
-            
-        except Exception as e:
-            logger.error(f"주식 알림 전송 중 오류: {e}")
-            return False
+        message = _format_stock_alert(stock_info)
+        return message is not None and await self.asend_message(message)
     
     def send_daily_summary(self, summary_data: Dict[str, Any]) -> bool:
+        """일일 요약 리포트 전송 (동기 호출용, 코루틴 안에서는 asend_daily_summary 사용)"""
+        message = _format_daily_summary(summary_data)
+        return message is not None and self.send_message(message)
+    
+    async def asend_daily_summary(self, summary_data: Dict[str, Any]) -> bool:
         """
         일일 요약 리포트 전송
         
         Args:
             summary_data: 요약 데이터
         """
-        try:
-            date = summary_data.get('date', datetime.now().strftime('%Y-%m-%d'))
-            total_stocks = summary_data.get('total_stocks', 0)
-            buy_signals = summary_data.get('buy_signals', 0)
-            sell_signals = summary_data.get('sell_signals', 0)
-            avg_accuracy = summary_data.get('avg_accuracy', 0)
-            top_picks = summary_data.get('top_picks', [])
-            
-            message = f"""
-📊 *일일 주식 분석 요약* 📊
-
-📅 *날짜*: {date}
-🔍 *분석 종목*: {total_stocks}개
-🟢 *매수 신호*: {buy_signals}개
-🔴 *매도 신호*: {sell_signals}개
-🎯 *평균 정확도*: {avg_accuracy:.1%}
-
-🏆 *오늘의 추천 종목*:
-            """.strip()
-            
-            for i, stock in enumerate(top_picks[:5], 1):
-                name = stock.get('name', stock.get('symbol', 'Unknown'))
-                expected_return = stock.get('expected_return', 0)
-                confidence = stock.get('confidence', 0)
-                message += f"\n{i}. {name} (기대수익률: {expected_return:+.1%}, 신뢰도: {confidence:.1%})"
-            
-            message += f"\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            return self.send_message(message)
-            
-        except Exception as e:
-            logger.error(f"일일 요약 전송 중 오류: {e}")
-            return False
+        message = _format_daily_summary(summary_data)
+        return message is not None and await self.asend_message(message)
     
     def send_market_status(self, market_data: Dict[str, Any]) -> bool:
+        """시장 현황 알림 전송 (동기 호출용, 코루틴 안에서는 asend_market_status 사용)"""
+        message = _format_market_status(market_data)
+        return message is not None and self.send_message(message)
+    
+    async def asend_market_status(self, market_data: Dict[str, Any]) -> bool:
         """
         시장 현황 알림 전송
         
         Args:
             market_data: 시장 데이터
         """
-        try:
-            market = market_data.get('market', 'KR')
-            status = market_data.get('status', 'UNKNOWN')
-            indices = market_data.get('indices', {})
-            
-            market_name = {'KR': '🇰🇷 한국', 'US': '🇺🇸 미국'}.get(market, market)
-            status_emoji = {
-                'OPEN': '🟢',
-                'CLOSED': '🔴',
-                'PRE_MARKET': '🟡',
-                'AFTER_HOURS': '🟠'
-            }.get(status, '⚪')
-            
-            message = f"""
-{status_emoji} *{market_name} 시장 현황* {status_emoji}
-
-📊 *상태*: {status}
-            """.strip()
-            
-            # 주요 지수 정보 추가
-            for index_name, index_data in indices.items():
-                value = index_data.get('value', 0)
-                change = index_data.get('change_percent', 0)
-                change_emoji = '📈' if change > 0 else '📉' if change < 0 else '➡️'
-                message += f"\n{change_emoji} *{index_name}*: {value:,.2f} ({change:+.2f}%)"
-            
-            message += f"\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            return self.send_message(message)
-            
-        except Exception as e:
-            logger.error(f"시장 현황 전송 중 오류: {e}")
-            return False
+        message = _format_market_status(market_data)
+        return message is not None and await self.asend_message(message)
     
     def send_error_alert(self, error_info: Dict[str, Any]) -> bool:
+        """시스템 오류 알림 전송 (동기 호출용, 코루틴 안에서는 asend_error_alert 사용)"""
+        message = _format_error_alert(error_info)
+        return message is not None and self.send_message(message, dedup_key=_error_dedup_key(error_info))
+    
+    async def asend_error_alert(self, error_info: Dict[str, Any]) -> bool:
         """
         시스템 오류 알림 전송
         
         Args:
             error_info: 오류 정보
         """
-        try:
-            component = error_info.get('component', 'Unknown')
-            error_type = error_info.get('error_type', 'Error')
-            message_text = error_info.get('message', 'Unknown error')
-            
-            message = f"""
-🚨 *시스템 오류 알림* 🚨
-
-🔧 *컴포넌트*: {component}
-⚠️ *오류 유형*: {error_type}
-📝 *메시지*: {message_text}
-
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-관리자 확인이 필요합니다.
-            """.strip()
-            
-            return self.send_message(message)
-            
-        except Exception as e:
-            logger.error(f"오류 알림 전송 중 오류: {e}")
-            return False
+        message = _format_error_alert(error_info)
+        return message is not None and await self.asend_message(message, dedup_key=_error_dedup_key(error_info))
 
-# 전역 텔레그램 알림 인스턴스
-telegram_notifier = TelegramNotifier()
+@functools.lru_cache(maxsize=1)
+def get_notifier() -> TelegramNotifier:
+    """전역 텔레그램 알림 인스턴스 (최초 호출 시 생성)"""
+    return TelegramNotifier()
 
 async def send_telegram_notification(message_type: str, data: Dict[str, Any]) -> bool:
     """
@@ -245,14 +552,15 @@ async def send_telegram_notification(message_type: str, data: Dict[str, Any]) ->
         성공 여부
     """
     try:
+        notifier = get_notifier()
         if message_type == 'stock_alert':
-            return telegram_notifier.send_stock_alert(data)
+            return await notifier.asend_stock_alert(data)
         elif message_type == 'daily_summary':
-            return telegram_notifier.send_daily_summary(data)
+            return await notifier.asend_daily_summary(data)
         elif message_type == 'market_status':
-            return telegram_notifier.send_market_status(data)
+            return await notifier.asend_market_status(data)
         elif message_type == 'error_alert':
-            return telegram_notifier.send_error_alert(data)
+            return await notifier.asend_error_alert(data)
         else:
             logger.warning(f"알 수 없는 메시지 타입: {message_type}")
             return False
@@ -262,7 +570,7 @@ async def send_telegram_notification(message_type: str, data: Dict[str, Any]) ->
         return False
 
 # 테스트 함수
-def test_telegram_integration():
+async def test_telegram_integration():
     """텔레그램 연동 테스트"""
     print("📱 텔레그램 연동 테스트 시작...")
     
@@ -272,10 +580,11 @@ def test_telegram_integration():
 
 주식 분석 시스템 텔레그램 연동 테스트입니다.
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ {_now_str()}
     """.strip()
     
-    success = telegram_notifier.send_message(test_message)
+    notifier = get_notifier()
+    success = await notifier.asend_message(test_message)
     
     if success:
         print("✅ 텔레그램 연동 테스트 성공!")
@@ -289,7 +598,7 @@ def test_telegram_integration():
             'signal': 'BUY',
             'confidence': 0.85
         }
-        telegram_notifier.send_stock_alert(test_stock)
+        await notifier.asend_stock_alert(test_stock)
         
     else:
         print("❌ 텔레그램 연동 테스트 실패")
@@ -298,4 +607,4 @@ def test_telegram_integration():
 
 if __name__ == "__main__":
     # 직접 실행 시 테스트
-    test_telegram_integration()
+    asyncio.run(test_telegram_integration())
@@ -4,20 +4,78 @@
 기존 중복된 데이터 수집 기능들을 하나로 통합
 """
 import sys
-from pathlib import Path
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional, Any
+from datetime import date, timedelta
+from typing import Callable, List, Dict, Optional, Any
 import asyncio
+import functools
+import time
+from collections import Counter, deque
 
-# Add app directory to path
-sys.path.append(str(Path(__file__).parent.parent.parent / "app"))
+import psycopg
+import requests
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.database.connection import get_db_session
+from app.database.connection import get_async_db_session
 from app.models.entities import StockMaster, StockDailyPrice, MarketRegion
 from app.services.kis_api import KISAPIClient
 from app.services.alpha_vantage_api import AlphaVantageAPIClient
+from app.utils.api_utils import AsyncRateLimiter
 from app.utils.structured_logger import StructuredLogger
 
+# API 응답 필드명 (stock_daily_price 컬럼 → 응답 키)
+KIS_PRICE_FIELDS = {
+    'trade_date': 'trade_date',  # YYYYMMDD
+    'open_price': 'open_price',
+    'high_price': 'high_price',
+    'low_price': 'low_price',
+    'close_price': 'close_price',
+    'volume': 'volume',
+}
+ALPHA_VANTAGE_PRICE_FIELDS = {
+    'trade_date': 'date',  # YYYY-MM-DD
+    'open_price': 'open',
+    'high_price': 'high',
+    'low_price': 'low',
+    'close_price': 'close',
+    'adjusted_close_price': 'adjusted_close',  # 분할/배당 반영 종가
+    'volume': 'volume',
+}
+
+# API별 동시 요청 수 (Alpha Vantage는 호출 제한이 엄격해 낮게 유지)
+KIS_FETCH_CONCURRENCY = 8
+ALPHA_VANTAGE_FETCH_CONCURRENCY = 2
+
+# 이 시간(초)보다 오래 걸린 API 호출은 종목별로 경고 로그를 남김
+SLOW_FETCH_SECONDS = 10.0
+
+# 시장별로 보관하는 최근 API 응답 시간 개수
+LATENCY_WINDOW = 1000
+
+# 종목 단위로 건너뛰는 오류 (API 통신 실패, 응답 형식 오류). 그 외 오류는 상위로 전파
+FETCH_ERRORS = (requests.RequestException, KeyError, ValueError, TypeError)
+
+# 역사적 데이터 저장 시 한 번에 INSERT할 최대 행 수
+WRITE_BATCH_SIZE = 1000
+
+# 이 행 수 이상이면 INSERT 대신 COPY + 스테이징 테이블로 저장
+COPY_MIN_ROWS = 200
+
+# COPY로 적재하는 컬럼 (나머지 컬럼은 DB 기본값 사용)
+DAILY_PRICE_COPY_COLUMNS = (
+    'stock_id', 'trade_date', 'open_price', 'high_price', 'low_price', 'close_price',
+    'adjusted_close_price', 'volume', 'data_source',
+    'daily_return_pct', 'price_change', 'price_change_pct'
+)
+
+# (stock_id, trade_date) 고유 인덱스와 충돌하는 행은 DB에서 건너뜀 (실제 삽입된 행만 반환)
+INSERT_DAILY_PRICES = (
+    pg_insert(StockDailyPrice)
+    .on_conflict_do_nothing(index_elements=['stock_id', 'trade_date'])
+    .returning(StockDailyPrice.stock_id)
+)
+
 
 class UnifiedDataCollector:
     """통합 데이터 수집기 - 모든 데이터 수집 기능을 하나로 통합"""
@@ -27,6 +85,12 @@ class UnifiedDataCollector:
         self.kis_client = KISAPIClient()
         self.alpha_vantage_client = AlphaVantageAPIClient()
         
+        # API별 비동기 호출 제한 (각 클라이언트의 호출 한도를 그대로 사용)
+        self.rate_limiters = {
+            'kis': AsyncRateLimiter(rate=self.kis_client.rate_limiter.calls_per_second),
+            'alpha_vantage': AsyncRateLimiter(rate=self.alpha_vantage_client.rate_limiter.calls_per_second),
+        }
+        
         # 주요 종목 리스트
         self.kr_symbols = [
             '005930',  # 삼성전자
@@ -73,17 +137,40 @@ class UnifiedDataCollector:
             'NOW',    # ServiceNow
             'UBER',   # Uber
         ]
+        
+        # 시장별 수집 설정 (한국/미국 수집 로직은 이 설정만 다르게 공유)
+        self.markets = {
+            MarketRegion.KR: {
+                'label': '한국',
+                'data_source': 'kis_api',
+                'fields': KIS_PRICE_FIELDS,
+                'concurrency': KIS_FETCH_CONCURRENCY,
+                'rate_limiter': self.rate_limiters['kis'],
+                'stock_info': self._get_korean_stock_info,
+            },
+            MarketRegion.US: {
+                'label': '미국',
+                'data_source': 'alpha_vantage_api',
+                'fields': ALPHA_VANTAGE_PRICE_FIELDS,
+                'concurrency': ALPHA_VANTAGE_FETCH_CONCURRENCY,
+                'rate_limiter': self.rate_limiters['alpha_vantage'],
+                'stock_info': self._get_us_stock_info,
+            },
+        }
+        
+        # 시장별 최근 API 응답 시간 (초)
+        self._latency = {region: deque(maxlen=LATENCY_WINDOW) for region in self.markets}
     
     async def collect_daily_data(self) -> bool:
         """일일 데이터 수집 (한국 + 미국)"""
         self.logger.info("📊 일일 데이터 수집 시작")
         
         try:
-            # 1. 한국 데이터 수집
-            kr_success = await self.collect_korean_daily_data()
-            
-            # 2. 미국 데이터 수집  
-            us_success = await self.collect_us_daily_data()
+            # 한국/미국 데이터 동시 수집 (API 제공자가 달라 호출 한도를 공유하지 않음)
+            kr_success, us_success = await self._gather_markets(
+                self.collect_korean_daily_data(),
+                self.collect_us_daily_data()
+            )
             
             if kr_success or us_success:
                 self.logger.info("✅ 일일 데이터 수집 완료")
@@ -100,232 +187,32 @@ class UnifiedDataCollector:
         """한국 시장 일일 데이터 수집"""
         self.logger.info("🇰🇷 한국 시장 최신 데이터 수집")
         
-        try:
-            with get_db_session() as db:
-                # 활성 한국 종목 목록
-                kr_stocks = db.query(StockMaster).filter_by(
-                    market_region=MarketRegion.KR.value,
-                    is_active=True
-                ).all()
-                
-                if not kr_stocks:
-                    self.logger.warning("한국 종목 없음")
-                    return False
-                
-                success_count = 0
-                today = date.today()
-                
-                self.logger.info(f"대상 종목: {len(kr_stocks)}개")
-                
-                for stock in kr_stocks:
-                    try:
-                        # 오늘 데이터가 이미 있는지 확인
-                        existing = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id,
-                            trade_date=today
-                        ).first()
-                        
-                        if existing:
-                            self.logger.debug(f"   {stock.stock_code}: 이미 존재")
-                            continue
-                        
-                        # KIS API에서 데이터 가져오기
-                        today = date.today()
-                        yesterday = today - timedelta(days=1)
-                        price_data = self.kis_client.get_stock_price_daily(
-                            stock.stock_code, 
-                            yesterday.strftime('%Y%m%d'), 
-                            today.strftime('%Y%m%d')
-                        )
-                        
-                        if not price_data:
-                            self.logger.debug(f"   {stock.stock_code}: KIS 데이터 없음")
-                            continue
-                        
-                        # 가장 최근 데이터 사용
-                        latest_data = price_data[-1] if price_data else None
-                        
-                        if not latest_data:
-                            self.logger.debug(f"   {stock.stock_code}: 유효한 데이터 없음")
-                            continue
-                        
-                        # 데이터 변환 (KIS API 응답 형식에 맞춤)
-                        trade_date = datetime.strptime(latest_data['date'], '%Y%m%d').date()
-                        open_price = float(latest_data['open'])
-                        high_price = float(latest_data['high'])
-                        low_price = float(latest_data['low'])
-                        close_price = float(latest_data['close'])
-                        volume = int(latest_data['volume'])
-                        
-                        # 이미 해당 날짜 데이터가 있는지 재확인
-                        existing_latest = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id,
-                            trade_date=trade_date
-                        ).first()
-                        
-                        if existing_latest:
-                            continue
-                        
-                        # 새 데이터 저장
-                        new_price = StockDailyPrice(
-                            stock_id=stock.stock_id,
-                            trade_date=trade_date,
-                            open_price=open_price,
-                            high_price=high_price,
-                            low_price=low_price,
-                            close_price=close_price,
-                            adjusted_close_price=close_price,
-                            volume=volume,
-                            data_source='kis_api'
-                        )
-                        
-                        # 일일 수익률 계산
-                        prev_price = db.query(StockDailyPrice).filter(
-                            StockDailyPrice.stock_id == stock.stock_id,
-                            StockDailyPrice.trade_date < trade_date
-                        ).order_by(StockDailyPrice.trade_date.desc()).first()
-                        
-                        if prev_price:
-                            new_price.daily_return_pct = (
-                                (float(latest_data['Close']) - float(prev_price.close_price)) / 
-                                float(prev_price.close_price) * 100
-                            )
-                            new_price.price_change = float(latest_data['Close']) - float(prev_price.close_price)
-                            new_price.price_change_pct = new_price.daily_return_pct
-                        
-                        db.add(new_price)
-                        db.commit()
-                        
-                        success_count += 1
-                    except Exception as e:
-                        self.logger.error(f"   ❌ {stock.stock_code} 수집 실패: {e}")
-                        continue
-                
-                self.logger.info(f"🎯 한국 데이터 수집 결과: {success_count}/{len(kr_stocks)}개 성공")
-                return success_count > 0
-                
-        except Exception as e:
-            self.logger.error(f"한국 데이터 수집 실패: {e}")
-            return False
+        # KIS 조회 기간 문자열은 실행 단위로 한 번만 생성
+        today = date.today()
+        today_str = today.strftime('%Y%m%d')
+        yesterday_str = (today - timedelta(days=1)).strftime('%Y%m%d')
+        
+        return await self._collect_daily(
+            MarketRegion.KR,
+            lambda stock_code: self.kis_client.get_stock_price_daily(stock_code, yesterday_str, today_str)
+        )
     
     async def collect_us_daily_data(self) -> bool:
         """미국 시장 일일 데이터 수집"""
         self.logger.info("🇺🇸 미국 시장 최신 데이터 수집")
         
-        try:
-            with get_db_session() as db:
-                # 활성 미국 종목 목록
-                us_stocks = db.query(StockMaster).filter_by(
-                    market_region=MarketRegion.US.value,
-                    is_active=True
-                ).all()
-                
-                if not us_stocks:
-                    self.logger.warning("미국 종목 없음")
-                    return False
-                
-                success_count = 0
-                today = date.today()
-                
-                self.logger.info(f"대상 종목: {len(us_stocks)}개")
-                
-                for stock in us_stocks:
-                    try:
-                        # 오늘 데이터가 이미 있는지 확인
-                        existing = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id,
-                            trade_date=today
-                        ).first()
-                        
-                        if existing:
-                            self.logger.debug(f"   {stock.stock_code}: 이미 존재")
-                            continue
-                        
-                        # Alpha Vantage API에서 데이터 가져오기
-                        price_data = self.alpha_vantage_api_client.get_daily_prices(stock.stock_code)
-                        
-                        if not price_data:
-                            self.logger.debug(f"   {stock.stock_code}: Alpha Vantage 데이터 없음")
-                            continue
-                        
-                        # 가장 최근 데이터 사용
-                        latest_data = price_data[-1] if price_data else None
-                        
-                        if not latest_data:
-                            self.logger.debug(f"   {stock.stock_code}: 유효한 데이터 없음")
-                            continue
-                        
-                        # 데이터 변환 (Alpha Vantage API 응답 형식에 맞춤)
-                        trade_date = datetime.strptime(latest_data['date'], '%Y-%m-%d').date()
-                        open_price = float(latest_data['open'])
-                        high_price = float(latest_data['high'])
-                        low_price = float(latest_data['low'])
-                        close_price = float(latest_data['close'])
-                        volume = int(latest_data['volume'])
-                        
-                        # 이미 해당 날짜 데이터가 있는지 재확인
-                        existing_latest = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id,
-                            trade_date=trade_date
-                        ).first()
-                        
-                        if existing_latest:
-                            continue
-                        
-                        # 새 데이터 저장
-                        new_price = StockDailyPrice(
-                            stock_id=stock.stock_id,
-                            trade_date=trade_date,
-                            open_price=open_price,
-                            high_price=high_price,
-                            low_price=low_price,
-                            close_price=close_price,
-                            adjusted_close_price=close_price,
-                            volume=volume,
-                            data_source='alpha_vantage_api'
-                        )
-                        
-                        # 일일 수익률 계산
-                        prev_price = db.query(StockDailyPrice).filter(
-                            StockDailyPrice.stock_id == stock.stock_id,
-                            StockDailyPrice.trade_date < trade_date
-                        ).order_by(StockDailyPrice.trade_date.desc()).first()
-                        
-                        if prev_price:
-                            new_price.daily_return_pct = (
-                                (close_price - float(prev_price.close_price)) / 
-                                float(prev_price.close_price) * 100
-                            )
-                            new_price.price_change = close_price - float(prev_price.close_price)
-                            new_price.price_change_pct = new_price.daily_return_pct
-                        
-                        db.add(new_price)
-                        db.commit()
-                        
-                        success_count += 1
-                        self.logger.debug(f"   ✅ {stock.stock_code}: {trade_date}")
-                        
-                    except Exception as e:
-                        self.logger.error(f"   ❌ {stock.stock_code} 수집 실패: {e}")
-                        continue
-                
-                self.logger.info(f"🎯 미국 데이터 수집 결과: {success_count}/{len(us_stocks)}개 성공")
-                return success_count > 0
-                
-        except Exception as e:
-            self.logger.error(f"미국 데이터 수집 실패: {e}")
-            return False
+        return await self._collect_daily(MarketRegion.US, self.alpha_vantage_client.get_daily_prices)
     
     async def collect_historical_data(self, days: int = 365) -> bool:
         """역사적 데이터 수집 (한국 + 미국)"""
         self.logger.info(f"📊 {days}일 역사적 데이터 수집 시작")
         
         try:
-            # 1. 한국 역사적 데이터 수집
-            kr_success = await self.collect_korean_historical_data(days)
-            
-            # 2. 미국 역사적 데이터 수집  
-            us_success = await self.collect_us_historical_data(days)
+            # 한국/미국 역사적 데이터 동시 수집
+            kr_success, us_success = await self._gather_markets(
+                self.collect_korean_historical_data(days),
+                self.collect_us_historical_data(days)
+            )
             
             if kr_success and us_success:
                 self.logger.info("✅ 역사적 데이터 수집 완료")
@@ -342,233 +229,409 @@ class UnifiedDataCollector:
         """한국 시장 역사적 데이터 수집"""
         self.logger.info(f"🇰🇷 한국 시장 {days}일 역사적 데이터 수집")
         
+        end_date = date.today()
+        start_str = (end_date - timedelta(days=days + 30)).strftime('%Y%m%d')
+        end_str = end_date.strftime('%Y%m%d')
+        
+        return await self._collect_historical(
+            MarketRegion.KR,
+            self.kr_symbols,
+            days,
+            lambda stock_code: self.kis_client.get_stock_price_daily(stock_code, start_str, end_str)
+        )
+    
+    async def collect_us_historical_data(self, days: int = 365) -> bool:
+        """미국 시장 역사적 데이터 수집"""
+        self.logger.info(f"🇺🇸 미국 시장 {days}일 역사적 데이터 수집")
+        
+        # compact는 최근 100거래일만 제공
+        return await self._collect_historical(
+            MarketRegion.US,
+            self.us_symbols,
+            days,
+            functools.partial(self.alpha_vantage_client.get_daily_prices,
+                              outputsize='full' if days > 100 else 'compact')
+        )
+    
+    async def _gather_markets(self, *collections) -> List[bool]:
+        """시장별 수집을 동시에 실행 (한 시장의 예외가 다른 시장 수집을 중단시키지 않음)"""
+        results = await asyncio.gather(*collections, return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ 시장 데이터 수집 오류: {result}")
+        return [result is True for result in results]
+    
+    async def _collect_daily(self, region: MarketRegion, fetch: Callable[[str], List[Dict]]) -> bool:
+        """시장 공통 일일 데이터 수집 (fetch: 종목 코드를 받아 API 응답 행 목록을 반환하는 동기 함수)"""
+        market = self.markets[region]
+        date_field = market['fields']['trade_date']
+        
         try:
-            with get_db_session() as db:
-                success_count = 0
+            async with get_async_db_session() as db:
+                # 활성 종목 목록
+                stocks = (await db.execute(
+                    select(StockMaster.stock_id, StockMaster.stock_code).where(
+                        StockMaster.market_region == region.value,
+                        StockMaster.is_active.is_(True)
+                    )
+                )).all()
+                
+                if not stocks:
+                    self.logger.warning(f"{market['label']} 종목 없음")
+                    return False
+                
+                today = date.today()
+                
+                self.logger.info(f"대상 종목: {len(stocks)}개")
+                
+                # 오늘 데이터가 없는 종목만 수집 대상 (전 종목의 최근 저장 행을 한 번에 조회)
+                last_rows = await self._load_last_prices(db, [stock.stock_id for stock in stocks])
+                target_stocks = []
+                pending_rows = []
+                for stock in stocks:
+                    last_row = last_rows.get(stock.stock_id)
+                    
+                    if last_row and last_row.trade_date >= today:
+                        self.logger.debug(f"   {stock.stock_code}: 이미 존재")
+                        continue
+                    target_stocks.append(stock)
                 
-                for symbol in self.kr_symbols:
+                # API에서 데이터 동시 조회
+                fetched = self._fetch_as_completed(
+                    fetch,
+                    target_stocks,
+                    [(stock.stock_code,) for stock in target_stocks],
+                    market['concurrency'],
+                    market['rate_limiter'],
+                    self._latency[region]
+                )
+                
+                async for stock, price_data in fetched:
                     try:
-                        # 종목 마스터 확인/생성
-                        stock = db.query(StockMaster).filter_by(
-                            market_region=MarketRegion.KR.value,
-                            stock_code=symbol
-                        ).first()
-                        
-                        if not stock:
-                            # 새 종목 생성
-                            stock_info = await self._get_korean_stock_info(symbol)
-                            stock = StockMaster(
-                                market_region=MarketRegion.KR.value,
-                                stock_code=symbol,
-                                stock_name=stock_info.get('name', symbol),
-                                stock_name_en=stock_info.get('name_en'),
-                                market_name=stock_info.get('market', 'KOSPI'),
-                                sector_classification=stock_info.get('sector'),
-                                data_provider='kis_api',
-                                is_active=True
-                            )
-                            db.add(stock)
-                            db.commit()
-                            db.refresh(stock)
-                        
-                        # 이미 있는 데이터 확인
-                        existing_count = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id
-                        ).count()
-                        
-                        if existing_count >= days:
-                            self.logger.debug(f"   {symbol}: 충분한 데이터 존재 ({existing_count}일)")
-                            success_count += 1
-                            continue
-                        
-                        # KIS API에서 역사적 데이터 수집
-                        end_date = date.today()
-                        start_date = end_date - timedelta(days=days + 30)
-                        price_data = self.kis_client.get_stock_price_daily(
-                            symbol,
-                            start_date.strftime('%Y%m%d'),
-                            end_date.strftime('%Y%m%d')
-                        )
+                        if isinstance(price_data, Exception):
+                            raise price_data
                         
                         if not price_data:
-                            self.logger.warning(f"   {symbol}: KIS 데이터 없음")
+                            self.logger.debug(f"   {stock.stock_code}: {market['data_source']} 데이터 없음")
                             continue
                         
-                        # 기존 데이터와 중복 제거
-                        new_records = 0
-                        for data_row in price_data:
-                            trade_date = datetime.strptime(data_row['date'], '%Y%m%d').date()
-                            
-                            existing = db.query(StockDailyPrice).filter_by(
-                                stock_id=stock.stock_id,
-                                trade_date=trade_date
-                            ).first()
-                            
-                            if existing:
-                                continue
-                            
-                            new_price = StockDailyPrice(
-                                stock_id=stock.stock_id,
-                                trade_date=trade_date,
-                                open_price=float(row['Open']),
-                                high_price=float(row['High']),
-                                low_price=float(row['Low']),
-                                close_price=float(row['Close']),
-                                adjusted_close_price=float(row['Close']),
-                                volume=int(row['Volume']),
-                                data_source='kis_api'
-                            )
-                            
-                            db.add(new_price)
-                            new_records += 1
-                        
-                        if new_records > 0:
-                            db.commit()
-                            self.logger.info(f"   ✅ {symbol}: {new_records}일 데이터 추가")
-                        
-                        success_count += 1
+                        # 가장 최근 거래일 행만 변환 (응답 정렬 순서에 의존하지 않음)
+                        latest_data = max(price_data, key=lambda row: row[date_field])
+                        new_price = self._to_price_row(stock.stock_id, latest_data, market)
+                        trade_date = new_price['trade_date']
+                        
+                        # 일일 수익률 계산 (저장된 직전 거래일 종가 기준)
+                        last_row = last_rows.get(stock.stock_id)
+                        if last_row and last_row.trade_date < trade_date and last_row.close_price:
+                            prev_close = float(last_row.close_price)
+                            new_price['price_change'] = new_price['close_price'] - prev_close
+                            new_price['daily_return_pct'] = new_price['price_change'] / prev_close * 100
+                            new_price['price_change_pct'] = new_price['daily_return_pct']
+                        
+                        # 저장은 루프 종료 후 한 번에 (이미 저장된 거래일은 ON CONFLICT DO NOTHING으로 건너뜀)
+                        pending_rows.append(new_price)
+                        self.logger.debug(f"   ✅ {stock.stock_code}: {trade_date}")
                         
-                    except Exception as e:
-                        self.logger.error(f"   ❌ {symbol} 수집 실패: {e}")
+                    except FETCH_ERRORS as e:
+                        self.logger.error(f"   ❌ {stock.stock_code} 수집 실패: {e}")
                         continue
                 
-                self.logger.info(f"🎯 한국 역사적 데이터 수집 결과: {success_count}/{len(self.kr_symbols)}개 성공")
+                # 전체 종목을 한 번의 INSERT/커밋으로 저장
+                success_count = sum((await self._write_daily_prices(db, pending_rows)).values())
+                
+                self.logger.info(f"🎯 {market['label']} 데이터 수집 결과: {success_count}/{len(stocks)}개 성공")
+                self._log_latency(region)
                 return success_count > 0
                 
-        except Exception as e:
-            self.logger.error(f"한국 역사적 데이터 수집 실패: {e}")
+        except SQLAlchemyError as e:
+            self.logger.error(f"{market['label']} 데이터 수집 실패: {e}")
             return False
     
-    async def collect_us_historical_data(self, days: int = 365) -> bool:
-        """미국 시장 역사적 데이터 수집"""
-        self.logger.info(f"🇺🇸 미국 시장 {days}일 역사적 데이터 수집")
+    async def _collect_historical(self, region: MarketRegion, symbols: List[str], days: int,
+                                  fetch: Callable[[str], List[Dict]]) -> bool:
+        """시장 공통 역사적 데이터 수집 (조회 기간보다 오래된 응답 행은 저장하지 않음)"""
+        market = self.markets[region]
+        start_date = date.today() - timedelta(days=days + 30)
         
         try:
-            with get_db_session() as db:
+            async with get_async_db_session() as db:
                 success_count = 0
+                target_stocks = []
+                inserted_counts = Counter()
                 
-                for symbol in self.us_symbols:
-                    try:
-                        # 종목 마스터 확인/생성
-                        stock = db.query(StockMaster).filter_by(
-                            market_region=MarketRegion.US.value,
-                            stock_code=symbol
-                        ).first()
-                        
-                        if not stock:
-                            # 새 종목 생성
-                            stock_info = await self._get_us_stock_info(symbol)
-                            stock = StockMaster(
-                                market_region=MarketRegion.US.value,
-                                stock_code=symbol,
-                                stock_name=stock_info.get('name', symbol),
-                                stock_name_en=stock_info.get('name', symbol),
-                                market_name=stock_info.get('market', 'NASDAQ'),
-                                sector_classification=stock_info.get('sector'),
-                                data_provider='alpha_vantage_api',
-                                is_active=True
-                            )
-                            db.add(stock)
-                            db.commit()
-                            db.refresh(stock)
-                        
+                # 종목 마스터 일괄 조회 (ORM 객체 대신 (stock_id, stock_code) 행만 로딩)
+                stocks_by_code = {
+                    stock.stock_code: stock
+                    for stock in (await db.execute(
+                        select(StockMaster.stock_id, StockMaster.stock_code).where(
+                            StockMaster.market_region == region.value,
+                            StockMaster.stock_code.in_(symbols)
+                        )
+                    )).all()
+                }
+                
+                # 종목별 저장된 행 수 일괄 조회
+                existing_counts = dict((await db.execute(
+                    select(StockDailyPrice.stock_id, func.count(StockDailyPrice.trade_date))
+                    .where(StockDailyPrice.stock_id.in_([stock.stock_id for stock in stocks_by_code.values()]))
+                    .group_by(StockDailyPrice.stock_id)
+                )).all())
+                
+                for symbol in symbols:
+                    # 종목 마스터 확인/생성
+                    stock = stocks_by_code.get(symbol)
+                    
+                    if stock:
                         # 이미 있는 데이터 확인
-                        existing_count = db.query(StockDailyPrice).filter_by(
-                            stock_id=stock.stock_id
-                        ).count()
-                        
-                        if existing_count >= days:
-                            self.logger.debug(f"   {symbol}: 충분한 데이터 존재 ({existing_count}일)")
-                            success_count += 1
-                            continue
-                        
-                        # Alpha Vantage API에서 역사적 데이터 수집
-                        price_data = self.alpha_vantage_api_client.get_historical_prices(symbol, days=days + 30)
+                        existing_count = existing_counts.get(stock.stock_id, 0)
+                    else:
+                        # 새 종목 생성 (ID는 조회 전에 한 번에 flush)
+                        stock_info = await market['stock_info'](symbol)
+                        stock = StockMaster(
+                            market_region=region.value,
+                            stock_code=symbol,
+                            stock_name=stock_info.get('name', symbol),
+                            stock_name_en=stock_info.get('name_en', symbol),
+                            market_name=stock_info.get('market'),
+                            sector_classification=stock_info.get('sector'),
+                            data_provider=market['data_source'],
+                            is_active=True
+                        )
+                        db.add(stock)
+                        existing_count = 0
+                    
+                    if existing_count >= days:
+                        self.logger.debug(f"   {symbol}: 충분한 데이터 존재 ({existing_count}일)")
+                        success_count += 1
+                        continue
+                    
+                    target_stocks.append(stock)
+                
+                # 새로 추가한 종목 마스터를 먼저 커밋 (stock_id 할당, 가격 배치 저장 실패 시에도 유지)
+                await db.commit()
+                
+                # API에서 역사적 데이터 동시 조회
+                fetched = self._fetch_as_completed(
+                    fetch,
+                    target_stocks,
+                    [(stock.stock_code,) for stock in target_stocks],
+                    market['concurrency'],
+                    market['rate_limiter'],
+                    self._latency[region]
+                )
+                
+                # 조회가 끝난 종목부터 행을 모아 WRITE_BATCH_SIZE 단위로 저장
+                pending_rows = []
+                async for stock, price_data in fetched:
+                    symbol = stock.stock_code
+                    try:
+                        if isinstance(price_data, Exception):
+                            raise price_data
                         
                         if not price_data:
-                            self.logger.warning(f"   {symbol}: Alpha Vantage 데이터 없음")
+                            self.logger.warning(f"   {symbol}: {market['data_source']} 데이터 없음")
                             continue
                         
-                        # 기존 데이터와 중복 제거
-                        new_records = 0
+                        mappings = []
                         for data_row in price_data:
-                            trade_date = datetime.strptime(data_row['date'], '%Y-%m-%d').date()
-                            
-                            existing = db.query(StockDailyPrice).filter_by(
-                                stock_id=stock.stock_id,
-                                trade_date=trade_date
-                            ).first()
-                            
-                            if existing:
-                                continue
-                            
-                            new_price = StockDailyPrice(
-                                stock_id=stock.stock_id,
-                                trade_date=trade_date,
-                                open_price=float(row['Open']),
-                                high_price=float(row['High']),
-                                low_price=float(row['Low']),
-                                close_price=float(row['Close']),
-                                adjusted_close_price=float(row['Close']),
-                                volume=int(row['Volume']),
-                                data_source='kis_api'
-                            )
-                            
-                            db.add(new_price)
-                            new_records += 1
-                        
-                        if new_records > 0:
-                            db.commit()
-                            self.logger.info(f"   ✅ {symbol}: {new_records}일 데이터 추가")
+                            new_price = self._to_price_row(stock.stock_id, data_row, market)
+                            if new_price['trade_date'] >= start_date:
+                                mappings.append(new_price)
                         
+                        pending_rows.extend(mappings)
                         success_count += 1
                         
-                    except Exception as e:
+                    except FETCH_ERRORS as e:
                         self.logger.error(f"   ❌ {symbol} 수집 실패: {e}")
                         continue
+                    
+                    if len(pending_rows) >= WRITE_BATCH_SIZE:
+                        inserted_counts.update(await self._write_daily_prices(db, pending_rows))
+                        pending_rows = []
                 
-                self.logger.info(f"🎯 미국 역사적 데이터 수집 결과: {success_count}/{len(self.us_symbols)}개 성공")
+                inserted_counts.update(await self._write_daily_prices(db, pending_rows))
+                
+                # 새로 저장된 행의 일일 수익률을 한 번에 계산
+                if inserted_counts:
+                    await self._update_daily_returns(db, list(inserted_counts))
+                    await db.commit()
+                
+                self.logger.info(f"🎯 {market['label']} 역사적 데이터 수집 결과: {success_count}/{len(symbols)}개 성공")
+                self._log_latency(region)
                 return success_count > 0
                 
-        except Exception as e:
-            self.logger.error(f"미국 역사적 데이터 수집 실패: {e}")
+        except SQLAlchemyError as e:
+            self.logger.error(f"{market['label']} 역사적 데이터 수집 실패: {e}")
             return False
     
+    def _to_price_row(self, stock_id: int, data_row: Dict[str, Any], market: Dict[str, Any]) -> Dict[str, Any]:
+        """API 응답 행을 stock_daily_price 저장 행으로 변환 (수익률은 비워 둠)"""
+        fields = market['fields']
+        close_price = float(data_row[fields['close_price']])
+        # 수정 종가를 제공하지 않는 API(KIS)는 종가를 그대로 사용
+        adjusted_field = fields.get('adjusted_close_price')
+        adjusted_close_price = float(data_row[adjusted_field]) if adjusted_field else close_price
+        return {
+            'stock_id': stock_id,
+            'trade_date': date.fromisoformat(data_row[fields['trade_date']]),  # YYYYMMDD도 허용 (Python 3.11+)
+            'open_price': float(data_row[fields['open_price']]),
+            'high_price': float(data_row[fields['high_price']]),
+            'low_price': float(data_row[fields['low_price']]),
+            'close_price': close_price,
+            'adjusted_close_price': adjusted_close_price,
+            'volume': int(data_row[fields['volume']]),
+            'data_source': market['data_source'],
+            'daily_return_pct': None,
+            'price_change': None,
+            'price_change_pct': None
+        }
+    
+    async def _load_last_prices(self, db, stock_ids: List[int]) -> Dict[int, Any]:
+        """종목별 가장 최근 (거래일, 종가) 행을 한 번의 DISTINCT ON 쿼리로 조회"""
+        if not stock_ids:
+            return {}
+        
+        return {
+            row.stock_id: row
+            for row in await db.execute(
+                select(StockDailyPrice.stock_id, StockDailyPrice.trade_date, StockDailyPrice.close_price)
+                .where(StockDailyPrice.stock_id.in_(stock_ids))
+                .distinct(StockDailyPrice.stock_id)
+                .order_by(StockDailyPrice.stock_id, StockDailyPrice.trade_date.desc())
+            )
+        }
+    
+    async def _update_daily_returns(self, db, stock_ids: List[int]) -> None:
+        """수익률이 비어 있는 행을 직전 거래일 종가(LAG) 기준으로 일괄 계산"""
+        prev_close = func.lag(StockDailyPrice.close_price).over(
+            partition_by=StockDailyPrice.stock_id,
+            order_by=StockDailyPrice.trade_date
+        )
+        lagged = select(
+            StockDailyPrice.price_id,
+            prev_close.label('prev_close')
+        ).where(StockDailyPrice.stock_id.in_(stock_ids)).subquery()
+        
+        price_change = StockDailyPrice.close_price - lagged.c.prev_close
+        return_pct = price_change / lagged.c.prev_close * 100
+        
+        await db.execute(
+            update(StockDailyPrice)
+            .where(
+                StockDailyPrice.price_id == lagged.c.price_id,
+                StockDailyPrice.daily_return_pct.is_(None),
+                lagged.c.prev_close != 0
+            )
+            .values(
+                daily_return_pct=return_pct,
+                price_change=price_change,
+                price_change_pct=return_pct
+            )
+            .execution_options(synchronize_session=False)
+        )
+    
+    async def _write_daily_prices(self, db, rows: List[Dict[str, Any]]) -> Counter:
+        """가격 행 일괄 저장 후 종목별 실제 삽입 건수 반환 (실패 시 해당 배치만 롤백)"""
+        if not rows:
+            return Counter()
+        
+        try:
+            if len(rows) >= COPY_MIN_ROWS:
+                inserted = await self._copy_daily_prices(db, rows)
+            else:
+                inserted = Counter(stock_id for (stock_id,) in await db.execute(INSERT_DAILY_PRICES, rows))
+            await db.commit()
+            self.logger.info(f"   💾 {len(rows)}행 중 {sum(inserted.values())}행 저장")
+            return inserted
+        except (SQLAlchemyError, psycopg.Error) as e:
+            await db.rollback()
+            self.logger.error(f"   ❌ 가격 데이터 {len(rows)}행 저장 실패: {e}")
+            return Counter()
+    
+    async def _copy_daily_prices(self, db, rows: List[Dict[str, Any]]) -> Counter:
+        """COPY로 임시 스테이징 테이블에 적재한 뒤 ON CONFLICT DO NOTHING으로 본 테이블에 반영"""
+        columns = ', '.join(DAILY_PRICE_COPY_COLUMNS)
+        
+        # 세션과 같은 트랜잭션의 psycopg 연결을 직접 사용
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        
+        async with raw_connection.driver_connection.cursor() as cur:
+            await cur.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS stock_daily_price_staging ON COMMIT DELETE ROWS "
+                f"AS SELECT {columns} FROM stock_daily_price WITH NO DATA"
+            )
+            async with cur.copy(f"COPY stock_daily_price_staging ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    await copy.write_row([row.get(column) for column in DAILY_PRICE_COPY_COLUMNS])
+            
+            await cur.execute(
+                f"INSERT INTO stock_daily_price ({columns}) "
+                f"SELECT {columns} FROM stock_daily_price_staging "
+                f"ON CONFLICT (stock_id, trade_date) DO NOTHING RETURNING stock_id"
+            )
+            return Counter(stock_id for (stock_id,) in await cur.fetchall())
+    
+    async def _fetch_as_completed(self, fetch, items: List[Any], args_list: List[tuple],
+                                  concurrency: int, rate_limiter: AsyncRateLimiter, latency: deque):
+        """동기 API 호출을 스레드에서 동시에 실행하고 완료되는 순서대로 (item, 결과) 전달
+        
+        semaphore로 동시 요청 수, rate_limiter로 호출 속도를 제한하며 실패한 호출은 예외 객체로 전달됨.
+        호출별 소요 시간은 latency에 기록
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(item, args):
+            async with semaphore:
+                await rate_limiter.acquire()
+                started = time.perf_counter()
+                try:
+                    return item, await asyncio.to_thread(fetch, *args)
+                except Exception as e:
+                    return item, e
+                finally:
+                    elapsed = time.perf_counter() - started
+                    latency.append(elapsed)
+                    if elapsed > SLOW_FETCH_SECONDS:
+                        self.logger.warning(f"   🐢 {args[0]} 응답 지연: {elapsed:.1f}초")
+        
+        for next_done in asyncio.as_completed([fetch_one(item, args) for item, args in zip(items, args_list)]):
+            yield await next_done
+    
+    def _log_latency(self, region: MarketRegion) -> None:
+        """시장별 최근 API 응답 시간 p50/p99 기록 (p99가 SLOW_FETCH_SECONDS를 넘으면 경고)"""
+        latency = sorted(self._latency[region])
+        if not latency:
+            return
+        
+        p50 = latency[len(latency) // 2]
+        p99 = latency[int((len(latency) - 1) * 0.99)]
+        message = f"⏱️ {self.markets[region]['label']} API 응답 시간: p50 {p50:.2f}초, p99 {p99:.2f}초 ({len(latency)}건)"
+        if p99 > SLOW_FETCH_SECONDS:
+            self.logger.warning(message)
+        else:
+            self.logger.info(message)
+    
     async def _get_korean_stock_info(self, symbol: str) -> Dict[str, Any]:
         """한국 종목 정보 가져오기"""
-        try:
-            # KIS API를 통한 종목 정보 조회 (간단한 버전)
-            return {
-                'name': f'KR_{symbol}',
-                'name_en': f'KR_{symbol}',
-                'market': 'KOSPI' if symbol in ['005930', '000660', '035420'] else 'KOSDAQ',
-                'sector': 'Technology'
-            }
-        except:
-            return {
-                'name': symbol,
-                'name_en': symbol,
-                'market': 'KOSPI',
-                'sector': 'Technology'
-            }
+        # KIS API를 통한 종목 정보 조회 (간단한 버전)
+        return {
+            'name': f'KR_{symbol}',
+            'name_en': f'KR_{symbol}',
+            'market': 'KOSPI' if symbol in ['005930', '000660', '035420'] else 'KOSDAQ',
+            'sector': 'Technology'
+        }
     
     async def _get_us_stock_info(self, symbol: str) -> Dict[str, Any]:
         """미국 종목 정보 가져오기"""
-        try:
-            # Alpha Vantage API를 통한 종목 정보 조회 (간단한 버전)
-            return {
-                'name': symbol,
-                'name_en': symbol,
-                'market': 'NASDAQ',
-                'sector': 'Technology'
-            }
-        except:
-            return {
-                'name': symbol,
-                'name_en': symbol,
-                'market': 'NASDAQ', 
-                'sector': 'Technology'
-            }
+        # Alpha Vantage API를 통한 종목 정보 조회 (간단한 버전)
+        return {
+            'name': symbol,
+            'name_en': symbol,
+            'market': 'NASDAQ',
+            'sector': 'Technology'
+        }
 
 
 # CLI 실행 함수
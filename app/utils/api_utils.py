@@ -1,10 +1,14 @@
 """
 API utilities for stock analysis application.
 """
+import re
 import time
+import random
+import asyncio
 import logging
+import threading
 from typing import Dict, List, Optional, Any, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -15,10 +19,14 @@ logger = logging.getLogger(__name__)
 class APIUtils:
     """Utility functions for API operations."""
     
+    # Common error message fields in various APIs
+    ERROR_FIELDS = ('error', 'message', 'msg', 'error_message', 'msg1', 'error_desc')
+    
     @staticmethod
     def create_session_with_retries(retries: int = 3, 
                                   backoff_factor: float = 0.3,
-                                  status_forcelist: List[int] = None) -> requests.Session:
+                                  status_forcelist: List[int] = None,
+                                  pool_maxsize: int = 20) -> requests.Session:
         """
         Create a requests session with retry strategy.
         
@@ -26,12 +34,13 @@ class APIUtils:
             retries: Number of retries
             backoff_factor: Backoff factor for retries
             status_forcelist: HTTP status codes to retry on
+            pool_maxsize: Keep-alive connections kept per host
             
         Returns:
             Configured requests session
         """
         if status_forcelist is None:
-            status_forcelist = [500, 502, 503, 504]
+            status_forcelist = [429, 500, 502, 503, 504]
         
         session = requests.Session()
         
@@ -41,14 +50,26 @@ class APIUtils:
             connect=retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
+            respect_retry_after_header=True,  # 429 waits for Retry-After
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_shared_session() -> requests.Session:
+        """
+        Get the process-wide session shared by all API clients.
+        
+        Returns:
+            Session whose keep-alive connection pool is reused across calls
+        """
+        return APIUtils.create_session_with_retries()
+    
     @staticmethod
     def rate_limited_request(delay: float = 0.1):
         """
@@ -58,18 +79,21 @@ class APIUtils:
             delay: Delay between requests in seconds
         """
         def decorator(func: Callable):
-            last_called = [0.0]
+            lock = threading.Lock()
+            next_call = [float('-inf')]
             
             @wraps(func)
             def wrapper(*args, **kwargs):
-                elapsed = time.time() - last_called[0]
-                left_to_wait = delay - elapsed
-                if left_to_wait > 0:
-                    time.sleep(left_to_wait)
+                # Space call starts `delay` apart; a call that ran longer than `delay` adds no wait
+                with lock:
+                    now = time.monotonic()
+                    start = max(now, next_call[0])
+                    next_call[0] = start + delay
+                
+                if start > now:
+                    time.sleep(start - now)
                 
-                ret = func(*args, **kwargs)
-                last_called[0] = time.time()
-                return ret
+                return func(*args, **kwargs)
             
             return wrapper
         return decorator
@@ -109,10 +133,7 @@ class APIUtils:
         Returns:
             Error message string
         """
-        # Common error message fields in various APIs
-        error_fields = ['error', 'message', 'msg', 'error_message', 'msg1', 'error_desc']
-        
-        for field in error_fields:
+        for field in APIUtils.ERROR_FIELDS:
             if field in response and response[field]:
                 return str(response[field])
         
@@ -145,7 +166,7 @@ class APIUtils:
                 logger.warning(f"API call attempt {attempt + 1} failed: {e}")
                 
                 if attempt < max_retries:
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                    time.sleep(APIUtils.get_retry_delay(e, retry_delay, attempt))
                 
             except Exception as e:
                 last_exception = e
@@ -154,6 +175,30 @@ class APIUtils:
         
         logger.error(f"API call failed after {max_retries + 1} attempts. Last error: {last_exception}")
         return None
+    
+    @staticmethod
+    def get_retry_delay(error: Exception, retry_delay: float, attempt: int,
+                        max_delay: float = 30.0) -> float:
+        """
+        Compute the wait before the next retry.
+        
+        Args:
+            error: Exception raised by the failed attempt
+            retry_delay: Base delay in seconds
+            attempt: Zero-based attempt number
+            max_delay: Upper bound for the delay
+            
+        Returns:
+            Server-advised Retry-After for 429/503 responses, otherwise a
+            full-jitter exponential delay so concurrent callers do not retry in lockstep
+        """
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), max_delay)
+        
+        return random.uniform(0, min(retry_delay * (2 ** attempt), max_delay))
 
 
 class KISAPIUtils:
@@ -246,6 +291,9 @@ class KISAPIUtils:
 class AlphaVantageAPIUtils:
     """Utility functions specific to Alpha Vantage API."""
     
+    # Phrases Alpha Vantage uses when a call is throttled (single precompiled scan)
+    RATE_LIMIT_PATTERN = re.compile(r'API call frequency|rate limit|premium|calls per minute', re.IGNORECASE)
+    
     @staticmethod
     def parse_alpha_vantage_daily_data(raw_data: Dict) -> Optional[List[Dict]]:
         """
@@ -301,16 +349,7 @@ class AlphaVantageAPIUtils:
         error_message = response.get('Error Message', '')
         note = response.get('Note', '')
         
-        rate_limit_indicators = [
-            'API call frequency',
-            'rate limit',
-            'premium',
-            'calls per minute'
-        ]
-        
-        full_response = f"{error_message} {note}".lower()
-        
-        return any(indicator in full_response for indicator in rate_limit_indicators)
+        return AlphaVantageAPIUtils.RATE_LIMIT_PATTERN.search(f"{error_message} {note}") is not None
     
     @staticmethod
     def extract_alpha_vantage_error(response: Dict) -> str:
@@ -329,6 +368,9 @@ class AlphaVantageAPIUtils:
         if 'Note' in response:
             return response['Note']
         
+        if 'Information' in response:
+            return response['Information']
+        
         return "Unknown Alpha Vantage API error"
 
 
@@ -413,14 +455,20 @@ class APIRateLimiter:
         """
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_called = 0.0
+        self.last_called = float('-inf')  # time.monotonic() of the latest reserved call
+        # Calls may come from worker threads (asyncio.to_thread)
+        self._lock = threading.Lock()
     
     def wait_if_needed(self) -> None:
         """Wait if needed to respect rate limit."""
-        elapsed = time.time() - self.last_called
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_called = time.time()
+        # Reserve the next call slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self.last_called + self.min_interval)
+            self.last_called = scheduled
+        
+        if scheduled > now:
+            time.sleep(scheduled - now)
     
     def __call__(self, func: Callable):
         """Use as decorator."""
@@ -428,4 +476,33 @@ class APIRateLimiter:
         def wrapper(*args, **kwargs):
             self.wait_if_needed()
             return func(*args, **kwargs)
-        return wrapper
\ No newline at end of file
+        return wrapper
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for coroutines."""
+    
+    def __init__(self, rate: float, per: float = 1.0, burst: int = 1):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate: Number of calls allowed per `per` seconds
+            per: Window length in seconds
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.per = per
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+        # Reserve the token before awaiting so concurrent callers queue up behind it
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.per / self.rate)
@@ -2,13 +2,28 @@
 Data processing utilities for stock analysis.
 """
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str, format_str: str) -> date:
+    """Parse a date string, memoizing successful results (exceptions are not cached)."""
+    # Fast paths for the two formats the API clients use; anything unusual falls back to strptime
+    if format_str == "%Y%m%d" and len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    if (format_str == "%Y-%m-%d" and len(date_str) == 10 and date_str.isascii()
+            and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, format_str).date()
+
+
 class DateUtils:
     """Utility functions for date operations."""
     
@@ -62,15 +77,13 @@ class DateUtils:
         Returns:
             List of trading days
         """
-        trading_days = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Monday=0, Friday=4
-                trading_days.append(current_date)
-            current_date += timedelta(days=1)
-            
-        return trading_days
+        # Walk proleptic ordinals instead of date objects; ordinal 1 (0001-01-01) is a Monday,
+        # so (ordinal + 6) % 7 equals date.weekday() without constructing weekend dates
+        return [
+            date.fromordinal(ordinal)
+            for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1)
+            if (ordinal + 6) % 7 < 5  # Monday=0, Friday=4
+        ]
     
     @staticmethod
     def parse_date_string(date_str: str, format_str: str = "%Y%m%d") -> Optional[date]:
@@ -85,7 +98,7 @@ class DateUtils:
             Parsed date or None if parsing fails
         """
         try:
-            return datetime.strptime(date_str, format_str).date()
+            return _parse_date_cached(date_str, format_str)
         except (ValueError, TypeError) as e:
             logger.warning(f"Failed to parse date string '{date_str}': {e}")
             return None
@@ -119,12 +132,15 @@ class DataValidationUtils:
         Returns:
             Float value or None
         """
-        if pd.isna(value) or value is None:
+        # Plain None/NaN checks instead of pd.isna: this runs per field in the API parsers,
+        # and pandas' NA types (pd.NA, NaT) already fail float() with TypeError
+        if value is None:
             return None
         try:
-            return float(value)
+            result = float(value)
         except (TypeError, ValueError):
             return None
+        return None if result != result else result
     
     @staticmethod
     def safe_int(value: Any) -> Optional[int]:
@@ -137,7 +153,8 @@ class DataValidationUtils:
         Returns:
             Int value or None
         """
-        if pd.isna(value) or value is None:
+        # NaN raises ValueError and pandas' NA types raise TypeError in int(), so no pd.isna needed
+        if value is None:
             return None
         try:
             return int(value)
@@ -163,7 +180,7 @@ class DataValidationUtils:
             return True
         
         # US stock codes are typically alphabetic
-        if stock_code.isalpha() and 1 <= len(stock_code) <= 5:
+        if len(stock_code) <= 5 and stock_code.isalpha():
             return True
         
         return False
@@ -242,7 +259,8 @@ class DataFrameUtils:
                     logger.warning(f"Column '{col}' not found in second DataFrame")
                     return pd.DataFrame()
             
-            return pd.merge(df1, df2, on=on, how=how)
+            # copy=False lets pandas reuse input blocks where the join doesn't need to reindex them
+            return pd.merge(df1, df2, on=on, how=how, copy=False)
             
         except Exception as e:
             logger.error(f"Failed to merge DataFrames: {e}")
@@ -259,38 +277,47 @@ class DataFrameUtils:
         Returns:
             DataFrame with additional features
         """
-        result = df.copy()
+        # Collect new columns first and append them in one concat (no copy of df, no per-column inserts)
+        features = {}
         
         try:
             # Price relative to moving averages
             if 'close_price' in df.columns and 'sma_20' in df.columns:
-                result['price_to_sma_20'] = df['close_price'] / df['sma_20'] - 1
+                features['price_to_sma_20'] = df['close_price'] / df['sma_20'] - 1
             
-            # RSI levels categorization
+            # RSI levels categorization: (0, 30] -> 0, (30, 70] -> 1, (70, 100] -> 2, otherwise NaN
             if 'rsi_14' in df.columns:
-                result['rsi_level'] = pd.cut(df['rsi_14'],
-                                           bins=[0, 30, 70, 100],
-                                           labels=[0, 1, 2]).astype(float)
+                rsi = df['rsi_14'].to_numpy(dtype=float)
+                rsi_level = np.searchsorted([30, 70], rsi).astype(np.float32)  # 0/1/2/NaN are exact in float32
+                rsi_level[~((rsi > 0) & (rsi <= 100))] = np.nan
+                features['rsi_level'] = rsi_level
             
             # MACD histogram
             if 'macd' in df.columns and 'macd_signal' in df.columns:
-                result['macd_histogram'] = df['macd'] - df['macd_signal']
+                features['macd_histogram'] = df['macd'] - df['macd_signal']
             
             # Bollinger Band position
             if all(col in df.columns for col in ['close_price', 'bb_upper', 'bb_lower']):
                 bb_range = df['bb_upper'] - df['bb_lower']
-                bb_range = bb_range.replace(0, 1)  # Avoid division by zero
-                result['bb_position'] = (df['close_price'] - df['bb_lower']) / bb_range
+                bb_range = np.where(bb_range == 0, 1, bb_range)  # Avoid division by zero
+                features['bb_position'] = (df['close_price'] - df['bb_lower']) / bb_range
             
             # Volume surge indicator
             if 'volume_ratio' in df.columns:
-                result['volume_surge'] = (df['volume_ratio'] > 1.5).astype(int)
-            
-            logger.debug(f"Added technical features to DataFrame with {len(result)} rows")
+                features['volume_surge'] = (df['volume_ratio'] > 1.5).astype(np.int8)
             
         except Exception as e:
             logger.error(f"Failed to add technical features: {e}")
-            
+        
+        if not features:
+            return df.copy()
+        
+        if df.columns.intersection(list(features)).empty:
+            result = pd.concat([df, pd.DataFrame(features, index=df.index)], axis=1, copy=False)
+        else:
+            # Recomputing on an enriched frame: overwrite existing feature columns in place
+            result = df.assign(**features)
+        logger.debug(f"Added technical features to DataFrame with {len(result)} rows")
         return result
     
     @staticmethod
@@ -324,8 +351,16 @@ class DataFrameUtils:
             na_threshold = int(len(result.columns) * drop_na_threshold)
             result = result.dropna(thresh=na_threshold)
             
-            # Replace infinite values with NaN
-            result = result.replace([float('inf'), float('-inf')], pd.NA)
+            # Replace infinite values with NaN; int/bool columns cannot hold inf, so only
+            # float columns are masked (keeping their dtype) and object columns scanned
+            for col in result.select_dtypes(include=[np.floating]).columns:
+                values = result[col].to_numpy()
+                infinite = np.isinf(values)
+                if infinite.any():
+                    result[col] = np.where(infinite, np.nan, values)
+            object_columns = result.select_dtypes(include=['object']).columns
+            if len(object_columns) > 0:
+                result[object_columns] = result[object_columns].replace([float('inf'), float('-inf')], pd.NA)
             
             logger.debug(f"Cleaned DataFrame: {len(df)} -> {len(result)} rows")
             
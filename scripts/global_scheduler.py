@@ -95,14 +95,14 @@ class GlobalScheduler:
         market_analysis_time = f"{analysis_hour:02d}:{analysis_minute:02d}"
         
         # 1. 한국 시장 관련 스케줄
-        schedule.every().day.at("08:30").do(lambda: asyncio.run(self._run_korean_premarket_recommendations())).tag("kr_premarket")  # 한국 장 시작 30분 전
+        schedule.every().day.at("08:30").do(self._run_alert_job, self._run_korean_premarket_recommendations).tag("kr_premarket")  # 한국 장 시작 30분 전
         schedule.every().day.at("19:00").do(self._collect_korean_data).tag("kr_data")  # KIS API 당일 데이터 확정 후 수집
-        schedule.every().day.at("19:15").do(lambda: asyncio.run(self._run_korean_market_analysis())).tag("kr_market")  # 데이터 수집 후 분석
+        schedule.every().day.at("19:15").do(self._run_alert_job, self._run_korean_market_analysis).tag("kr_market")  # 데이터 수집 후 분석
         
         # 2. 미국 시장 관련 스케줄 (동적)
-        schedule.every().day.at(premarket_start_kr).do(lambda: asyncio.run(self._run_us_premarket_alert())).tag("us_premarket")
-        schedule.every().day.at(regular_start_kr).do(lambda: asyncio.run(self._run_us_market_open_alert())).tag("us_market_open")
-        schedule.every().day.at(market_analysis_time).do(lambda: asyncio.run(self._run_us_market_analysis())).tag("us_market")
+        schedule.every().day.at(premarket_start_kr).do(self._run_alert_job, self._run_us_premarket_alert).tag("us_premarket")
+        schedule.every().day.at(regular_start_kr).do(self._run_alert_job, self._run_us_market_open_alert).tag("us_market_open")
+        schedule.every().day.at(market_analysis_time).do(self._run_alert_job, self._run_us_market_analysis).tag("us_market")
         
         # 3. 데이터 수집 스케줄 (미국만 남김 - 한국은 위로 이동)
         schedule.every().day.at(aftermarket_end_kr).do(self._collect_us_data).tag("us_data")
@@ -127,7 +127,7 @@ class GlobalScheduler:
         schedule.every().hour.at(":00").do(self._health_check).tag("health")
         
         # 7. 긴급 알림 체크 (4시간마다, 중복 방지)
-        schedule.every(4).hours.do(lambda: asyncio.run(self._check_emergency_alerts())).tag("emergency")
+        schedule.every(4).hours.do(self._run_alert_job, self._check_emergency_alerts).tag("emergency")
         
         print("✅ 동적 스케줄 설정 완료:")
         print(f"   🇰🇷 한국 프리마켓 추천: 매일 08:30")
@@ -510,12 +510,10 @@ class GlobalScheduler:
             
             # 알림 서비스 직접 사용 (더 안정적)
             from app.services.notification import NotificationService
-            from app.services.telegram_service import TelegramNotifier
             
             # 텔레그램 알림 시도
             try:
-                telegram = TelegramNotifier()
-                telegram_success = telegram.send_message(f"{title}\n\n{content}")
+                telegram_success = await self._send_telegram(f"{title}\n\n{content}")
                 if telegram_success:
                     print("   ✅ 텔레그램 알림 전송 성공")
                 else:
@@ -617,6 +615,29 @@ class GlobalScheduler:
         print("⚠️ 레거시 스케줄 메서드 호출됨 - _setup_dynamic_schedules 사용 권장")
         self._setup_dynamic_schedules()
     
+    def _run_alert_job(self, job, *args, **kwargs):
+        """알림 시스템을 쓰는 비동기 작업을 새 이벤트 루프에서 실행
+        
+        작업마다 asyncio.run 으로 루프가 바뀌므로 알림용 HTTP 클라이언트는 같은 루프 안에서 닫음
+        """
+        async def run():
+            try:
+                return await job(*args, **kwargs)
+            finally:
+                await self.alert_system.aclose()
+        
+        return asyncio.run(run())
+    
+    async def _send_telegram(self, message: str) -> bool:
+        """텔레그램 메시지 전송 후 HTTP 클라이언트 정리 (전송 중 예외가 나도 닫음)"""
+        from app.services.telegram_service import TelegramNotifier
+        
+        telegram = TelegramNotifier()
+        try:
+            return await telegram.asend_message(message)
+        finally:
+            await telegram.aclose()
+    
     async def _run_korean_premarket_recommendations(self):
         """한국 프리마켓 추천 실행 (08:30 - 장 시작 30분 전)"""
         print("\n🇰🇷 한국 프리마켓 추천 시작 (08:30)")
@@ -680,12 +701,13 @@ class GlobalScheduler:
             
             # 3. 마감 후 요약 알림 전송
             print("📢 한국 시장 요약 알림...")
-            kr_summary = self.alert_system.generate_market_close_summary(MarketRegion.KR)
+            alert_ctx = self.alert_system.build_context()
+            kr_summary = await self.alert_system.generate_market_close_summary(MarketRegion.KR, alert_ctx)
             if kr_summary:
                 await self.alert_system.send_alert(kr_summary)
             
             # 4. 하락장 경고 체크
-            bear_warning = self.alert_system.generate_bear_market_warning()
+            bear_warning = await self.alert_system.generate_bear_market_warning(alert_ctx)
             if bear_warning:
                 await self.alert_system.send_alert(bear_warning)
             
@@ -703,7 +725,7 @@ class GlobalScheduler:
         
         try:
             # 프리마켓 알림 생성 및 전송
-            premarket_alert = self.alert_system.generate_premarket_alert()
+            premarket_alert = await self.alert_system.generate_premarket_alert()
             if premarket_alert:
                 success = await self.alert_system.send_alert(premarket_alert)
                 if success:
@@ -763,7 +785,7 @@ class GlobalScheduler:
             
             # 3. 마감 후 요약 알림 전송
             print("📢 미국 시장 요약 알림...")
-            us_summary = self.alert_system.generate_market_close_summary(MarketRegion.US)
+            us_summary = await self.alert_system.generate_market_close_summary(MarketRegion.US)
             if us_summary:
                 await self.alert_system.send_alert(us_summary)
             
@@ -965,9 +987,7 @@ class GlobalScheduler:
                 message = f"❌ {target_date} 성능 평가 실패\n{error if error else '알 수 없는 오류'}"
             
             # 텔레그램으로 알림 전송
-            from app.services.telegram_service import TelegramNotifier
-            telegram = TelegramNotifier()
-            telegram.send_message(message)
+            await self._send_telegram(message)
             
             print(f"📱 성능 평가 알림 전송 완료")
             
@@ -1007,9 +1027,7 @@ class GlobalScheduler:
 • 수동 학습 실행 고려"""
             
             # 텔레그램으로 알림 전송
-            from app.services.telegram_service import TelegramNotifier
-            telegram = TelegramNotifier()
-            telegram.send_message(message)
+            await self._send_telegram(message)
             
             print(f"📱 일일 학습 알림 전송 완료")
             
@@ -1058,9 +1076,7 @@ class GlobalScheduler:
 ⚠️ 일일 학습은 계속 정상 작동 중"""
             
             # 텔레그램으로 알림 전송
-            from app.services.telegram_service import TelegramNotifier
-            telegram = TelegramNotifier()
-            telegram.send_message(message)
+            await self._send_telegram(message)
             
             print(f"📱 주간 학습 알림 전송 완료")
             
@@ -1472,7 +1488,7 @@ class GlobalScheduler:
         
         try:
             if asyncio.iscoroutinefunction(task):
-                result = asyncio.run(task())
+                result = self._run_alert_job(task)
             else:
                 result = task()
             
@@ -1573,11 +1589,12 @@ system_version: "realtime_learning_v1.0"
                 
                 # 시스템 알림 전송 (선택적)
                 try:
-                    asyncio.run(self.alert_system.send_system_notification(
+                    self._run_alert_job(
+                        self.alert_system.send_system_notification,
                         title="월간 보고서 생성 완료",
                         message=alert_message,
                         urgency="INFO"
-                    ))
+                    )
                 except Exception as notification_error:
                     print(f"   ⚠️ 알림 전송 실패: {notification_error}")
                 
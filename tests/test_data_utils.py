@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+데이터 처리 유틸리티 단위 테스트
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# app 모듈 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.utils.data_utils import DataFrameUtils
+
+
+def _price_frame():
+    return pd.DataFrame({
+        'close_price': [100.0, 105.0, 95.0, 110.0],
+        'sma_20': [98.0, 100.0, 100.0, 100.0],
+        'rsi_14': [25.0, 50.0, 75.0, np.nan],
+        'macd': [1.0, 2.0, -1.0, 0.5],
+        'macd_signal': [0.5, 1.5, 0.0, 0.5],
+        'bb_upper': [110.0, 110.0, 100.0, 110.0],
+        'bb_lower': [90.0, 90.0, 100.0, 90.0],
+        'volume_ratio': [1.0, 2.0, 1.6, 0.5],
+    })
+
+
+def test_add_technical_features_values():
+    """기술 지표 피처 계산값 확인"""
+    result = DataFrameUtils.add_technical_features(_price_frame())
+
+    np.testing.assert_allclose(result['rsi_level'], [0, 1, 2, np.nan])
+    np.testing.assert_allclose(result['macd_histogram'], [0.5, 0.5, -1.0, 0.0])
+    np.testing.assert_allclose(result['bb_position'], [0.5, 0.75, -5.0, 1.0])
+    assert result['volume_surge'].tolist() == [0, 1, 1, 0]
+
+
+def test_add_technical_features_recompute_keeps_unique_columns():
+    """이미 피처가 있는 DataFrame 에 다시 적용해도 컬럼이 중복되지 않고 값/순서가 유지됨"""
+    df = _price_frame()
+    df['rsi_level'] = -1.0  # 이전 계산 결과 (덮어써야 함)
+    once = DataFrameUtils.add_technical_features(_price_frame())
+
+    result = DataFrameUtils.add_technical_features(df)
+    twice = DataFrameUtils.add_technical_features(once)
+
+    assert result.columns.is_unique
+    assert list(result.columns[:len(df.columns)]) == list(df.columns)
+    np.testing.assert_allclose(result['rsi_level'], once['rsi_level'])
+    assert twice.columns.is_unique
+    pd.testing.assert_frame_equal(twice, once)
+    assert (df['rsi_level'] == -1.0).all()  # 입력은 변경하지 않음
+
+
+if __name__ == "__main__":
+    test_add_technical_features_values()
+    test_add_technical_features_recompute_keeps_unique_columns()
+    print("✅ 데이터 처리 유틸리티 테스트 통과")
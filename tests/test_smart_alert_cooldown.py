@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+스마트 알림 쿨다운 예약/해제 단위 테스트 (실제 알림 전송 없음)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# app 모듈 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.smart_alert_system import AlertType, SmartAlertSystem
+
+
+@pytest.fixture
+def alert_system(monkeypatch):
+    """하락장 경고만 생성하고 send_alert 호출을 sent 에 기록하는 알림 시스템"""
+    system = SmartAlertSystem()
+    system.sent = []
+    system.send_results = []
+
+    async def fake_send(alert):
+        await asyncio.sleep(0)  # 겹치는 주기가 끼어들 수 있도록 양보
+        system.sent.append(alert)
+        return system.send_results.pop(0) if system.send_results else True
+
+    async def fake_bear_warning(ctx=None):
+        return "bear_warning"
+
+    monkeypatch.setattr(system, 'send_alert', fake_send)
+    monkeypatch.setattr(system, 'generate_bear_market_warning', fake_bear_warning)
+    monkeypatch.setattr(system, 'build_context', lambda: None)
+    monkeypatch.setattr(system, 'should_send_premarket_alert', lambda: False)
+    monkeypatch.setattr(system, 'should_send_market_close_alert', lambda region: False)
+    return system
+
+
+async def _alert(value):
+    return value
+
+
+def test_claim_alert_reserves_cooldown(alert_system):
+    """예약에 성공하면 쿨다운이 끝날 때까지 같은 유형은 다시 예약되지 않음"""
+    assert alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING) is True
+    assert alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING) is False
+    assert alert_system.should_send_alert(AlertType.BEAR_MARKET_WARNING) is False
+    # 다른 유형은 영향 없음
+    assert alert_system.should_send_alert(AlertType.PREMARKET_RECOMMENDATIONS) is True
+
+
+@pytest.mark.anyio
+async def test_send_generated_keeps_claim_on_success(alert_system):
+    """전송에 성공하면 예약한 쿨다운 유지"""
+    alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING)
+
+    assert await alert_system._send_generated(_alert("alert"), AlertType.BEAR_MARKET_WARNING) == 1
+    assert alert_system.should_send_alert(AlertType.BEAR_MARKET_WARNING) is False
+
+
+@pytest.mark.anyio
+async def test_send_generated_releases_claim_on_failure(alert_system):
+    """알림이 없거나 전송에 실패하면 예약한 쿨다운을 해제"""
+    alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING)
+    assert await alert_system._send_generated(_alert(None), AlertType.BEAR_MARKET_WARNING) == 0
+    assert alert_system.should_send_alert(AlertType.BEAR_MARKET_WARNING) is True
+
+    alert_system.send_results = [False]
+    alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING)
+    assert await alert_system._send_generated(_alert("alert"), AlertType.BEAR_MARKET_WARNING) == 0
+    assert alert_system.should_send_alert(AlertType.BEAR_MARKET_WARNING) is True
+
+
+@pytest.mark.anyio
+async def test_send_generated_releases_claim_on_error(alert_system):
+    """알림 생성 중 예외가 나도 예약을 해제하고 예외는 그대로 전달"""
+    async def broken():
+        raise RuntimeError("ml engine down")
+
+    alert_system._claim_alert(AlertType.BEAR_MARKET_WARNING)
+    with pytest.raises(RuntimeError):
+        await alert_system._send_generated(broken(), AlertType.BEAR_MARKET_WARNING)
+    assert alert_system.should_send_alert(AlertType.BEAR_MARKET_WARNING) is True
+
+
+@pytest.mark.anyio
+async def test_overlapping_cycles_send_once(alert_system):
+    """겹쳐 실행된 알림 주기에서도 같은 알림은 한 번만 전송"""
+    results = await asyncio.gather(alert_system.run_alert_cycle(), alert_system.run_alert_cycle())
+
+    assert sorted(results) == [False, True]
+    assert alert_system.sent == ["bear_warning"]
+
+
+@pytest.mark.anyio
+async def test_failed_cycle_allows_next_cycle(alert_system):
+    """전송에 실패한 알림은 다음 주기에 다시 시도"""
+    alert_system.send_results = [False]
+
+    assert await alert_system.run_alert_cycle() is False
+    assert await alert_system.run_alert_cycle() is True
+    assert alert_system.sent == ["bear_warning", "bear_warning"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
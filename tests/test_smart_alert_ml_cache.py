@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+스마트 알림 ML 호출 캐시 단위 테스트 (실제 ML 엔진 없음)
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# app 모듈 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.models.entities import MarketRegion
+from app.services.smart_alert_system import SmartAlertSystem
+
+
+class FakeEngine:
+    """호출 횟수와 동시 실행 수를 기록하는 ML 엔진"""
+
+    def __init__(self):
+        self.calls = []
+        self.failures = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _run(self, name):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.05)
+            self.calls.append(name)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("model not ready")
+            return name
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def detect_market_regime(self):
+        return self._run('regime')
+
+    def predict_stocks(self, region, top_n=10):
+        return self._run((region, top_n))
+
+
+@pytest.fixture
+def alert_system():
+    system = SmartAlertSystem()
+    system.__dict__['ml_engine'] = FakeEngine()  # cached_property 대신 가짜 엔진 사용
+    return system
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_load(alert_system):
+    """동시에 캐시를 놓친 호출자는 한 번의 엔진 호출 결과를 함께 사용"""
+    results = await asyncio.gather(*(alert_system._cached_regime() for _ in range(4)))
+
+    assert results == ['regime'] * 4
+    assert alert_system.ml_engine.calls == ['regime']
+    # 캐시 유효 시간 안에서는 엔진을 다시 호출하지 않음
+    assert await alert_system._cached_regime() == 'regime'
+    assert alert_system.ml_engine.calls == ['regime']
+
+
+@pytest.mark.anyio
+async def test_engine_calls_do_not_overlap(alert_system):
+    """서로 다른 키의 호출도 엔진에서는 한 번에 하나씩 실행"""
+    await asyncio.gather(
+        alert_system._cached_regime(),
+        alert_system._cached_predictions(MarketRegion.KR, top_n=10),
+        alert_system._cached_predictions(MarketRegion.US, top_n=10),
+    )
+
+    assert len(alert_system.ml_engine.calls) == 3
+    assert alert_system.ml_engine.max_active == 1
+
+
+@pytest.mark.anyio
+async def test_failed_load_is_not_cached(alert_system):
+    """엔진 호출이 실패하면 기다리던 호출자 모두 예외를 받고 다음 호출에서 다시 시도"""
+    alert_system.ml_engine.failures = 1
+
+    results = await asyncio.gather(alert_system._cached_regime(), alert_system._cached_regime(),
+                                   return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    assert await alert_system._cached_regime() == 'regime'
+    assert alert_system.ml_engine.calls == ['regime', 'regime']
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
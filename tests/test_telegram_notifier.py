@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+텔레그램 알림 발송 클래스 단위 테스트 (실제 API 호출 없음)
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+# app 모듈 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services import telegram_service
+from app.services.telegram_service import (
+    TELEGRAM_MAX_LENGTH, TRUNCATION_SUFFIX, TelegramNotifier, truncate_message, _telegram_length
+)
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    """전송 결과를 기록하는 활성화된 알림 인스턴스 (sendMessage 호출 대신 posted 에 기록)"""
+    monkeypatch.setattr(telegram_service, '_settings', lambda: SimpleNamespace(
+        telegram_enabled=True, telegram_bot_token="test-token", telegram_chat_id="test-chat"
+    ))
+    notifier = TelegramNotifier()
+    notifier.posted = []
+    notifier.post_results = []
+
+    async def fake_post(payload):
+        notifier.posted.append((payload['text'], notifier._get_client()))
+        return notifier.post_results.pop(0) if notifier.post_results else True
+
+    def fake_post_sync(payload):
+        time.sleep(0.01)  # 동시 호출이 겹치도록 잠시 대기
+        notifier.posted.append((payload['text'], notifier._get_sync_client()))
+        return notifier.post_results.pop(0) if notifier.post_results else True
+
+    notifier._post_message = fake_post
+    notifier._post_message_sync = fake_post_sync
+    yield notifier
+    notifier.close()
+
+
+def test_truncate_message_keeps_short_messages():
+    """길이 제한 이내 메시지는 그대로 반환"""
+    assert truncate_message("안녕하세요") == "안녕하세요"
+    assert truncate_message("a" * TELEGRAM_MAX_LENGTH) == "a" * TELEGRAM_MAX_LENGTH
+    # 이모지는 2 코드 단위로 계산
+    assert truncate_message("😀" * (TELEGRAM_MAX_LENGTH // 2)) == "😀" * (TELEGRAM_MAX_LENGTH // 2)
+
+
+def test_truncate_message_cuts_to_telegram_limit():
+    """제한을 넘으면 UTF-16 기준 제한 안으로 자르고 생략 표시를 붙임"""
+    for text in ["a" * (TELEGRAM_MAX_LENGTH + 1), "😀" * TELEGRAM_MAX_LENGTH, "a" + "😀" * TELEGRAM_MAX_LENGTH]:
+        result = truncate_message(text)
+        assert result.endswith(TRUNCATION_SUFFIX)
+        assert _telegram_length(result) <= TELEGRAM_MAX_LENGTH
+        # 서로게이트 반쪽이 남지 않아야 함
+        result.encode('utf-8')
+
+
+def test_send_message_is_synchronous(notifier):
+    """동기 send_* 는 bool 을 반환하고 이벤트 루프 없이 공유 동기 클라이언트를 재사용"""
+    assert notifier.send_message("동기 전송") is True
+    assert notifier.send_daily_summary({'total_stocks': 3}) is True
+
+    assert [text for text, _ in notifier.posted][0] == "동기 전송"
+    clients = {client for _, client in notifier.posted}
+    assert clients == {notifier._sync_client}
+    assert isinstance(notifier._sync_client, httpx.Client)
+    assert notifier._client is None  # 비동기 클라이언트는 만들지 않음
+
+    shared = notifier._sync_client
+    notifier.close()
+    assert shared.is_closed
+
+
+def test_concurrent_sync_sends_are_deduplicated(notifier):
+    """여러 스레드에서 같은 메시지를 동시에 보내도 한 번만 전송"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: notifier.send_message("중복"), range(8)))
+
+    assert results == [True] * 8
+    assert len(notifier.posted) == 1
+    assert notifier.deduped_count == 7
+
+
+def test_post_message_sync_retries_after_429(monkeypatch):
+    """동기 전송도 429 응답이면 retry_after 만큼 기다린 뒤 재시도"""
+    monkeypatch.setattr(telegram_service, '_settings', lambda: SimpleNamespace(
+        telegram_enabled=True, telegram_bot_token="test-token", telegram_chat_id="test-chat"
+    ))
+    delays = []
+    monkeypatch.setattr(telegram_service, 'sleep', delays.append)
+    responses = [
+        httpx.Response(429, json={'ok': False, 'parameters': {'retry_after': 3}}),
+        httpx.Response(200, json={'ok': True}),
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    notifier = TelegramNotifier()
+    notifier._sync_client = httpx.Client(base_url=telegram_service.TELEGRAM_API_URL,
+                                         transport=httpx.MockTransport(handler))
+
+    assert notifier.send_message("한도 초과 후 성공") is True
+    assert delays == [3]
+    assert len(requests) == 2
+    assert requests[0].url.path == "/bottest-token/sendMessage"
+    notifier.close()
+
+
+def test_send_message_inside_running_loop(notifier):
+    """이벤트 루프 안에서 동기 API 를 호출해도 전송이 끝난 뒤 결과를 반환"""
+    async def caller():
+        return notifier.send_error_alert({'component': 'scheduler', 'error_type': 'Timeout'})
+
+    assert asyncio.run(caller()) is True
+    assert len(notifier.posted) == 1
+
+
+def test_sync_send_when_disabled(notifier):
+    """비활성화 상태에서는 전송하지 않고 False"""
+    notifier.enabled = False
+    assert notifier.send_message("무시") is False
+    assert notifier.posted == []
+
+
+@pytest.mark.anyio
+async def test_asend_message_uses_shared_client(notifier):
+    """asend_* 는 현재 루프의 공유 클라이언트로 전송하고 aclose 에서 정리"""
+    assert await notifier.asend_message("비동기 1") is True
+    assert await notifier.asend_stock_alert({'symbol': '005930', 'current_price': 70000}) is True
+
+    clients = {client for _, client in notifier.posted}
+    assert clients == {notifier._client}
+
+    shared = notifier._client
+    await notifier.aclose()
+    assert shared.is_closed
+
+
+@pytest.mark.anyio
+async def test_failed_send_can_be_retried(notifier):
+    """전송에 실패한 메시지는 중복으로 기록되지 않아 바로 재시도 가능"""
+    notifier.post_results = [False, True]
+
+    assert await notifier.asend_message("재시도") is False
+    assert await notifier.asend_message("재시도") is True
+    assert await notifier.asend_message("재시도") is True  # 성공 후에는 중복으로 생략
+    assert [text for text, _ in notifier.posted] == ["재시도", "재시도"]
+    assert notifier.deduped_count == 1
+    await notifier.aclose()
+
+
+@pytest.mark.anyio
+async def test_failed_error_alert_can_be_retried(notifier):
+    """component:error_type 키의 오류 알림도 실패/예외 후 다시 전송"""
+    error_info = {'component': 'collector', 'error_type': 'Timeout'}
+
+    async def failing_post(payload):
+        raise RuntimeError("network down")
+
+    sent_post = notifier._post_message
+    notifier._post_message = failing_post
+    assert await notifier.asend_error_alert(error_info) is False
+
+    notifier._post_message = sent_post
+    assert await notifier.asend_error_alert(error_info) is True
+    assert len(notifier.posted) == 1
+    await notifier.aclose()
+
+
+if __name__ == "__main__":
+    test_truncate_message_keeps_short_messages()
+    test_truncate_message_cuts_to_telegram_limit()
+    print("✅ 텔레그램 알림 단위 테스트 통과")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+통합 데이터 수집기 가격 행 변환/저장 단위 테스트 (실제 API/DB 호출 없음)
+"""
+import sys
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+# app 모듈 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.unified_data_collector import (
+    ALPHA_VANTAGE_PRICE_FIELDS, COPY_MIN_ROWS, INSERT_DAILY_PRICES, KIS_PRICE_FIELDS, UnifiedDataCollector
+)
+
+KR_MARKET = {'fields': KIS_PRICE_FIELDS, 'data_source': 'kis_api'}
+US_MARKET = {'fields': ALPHA_VANTAGE_PRICE_FIELDS, 'data_source': 'alpha_vantage_api'}
+
+
+def _collector():
+    """API 클라이언트를 만들지 않은 수집기 (행 변환/저장 메서드만 사용)"""
+    collector = UnifiedDataCollector.__new__(UnifiedDataCollector)
+    collector.logger = MagicMock()
+    return collector
+
+
+def _rows(count, stock_id=1):
+    return [{'stock_id': stock_id, 'trade_date': date(2024, 1, 1)} for _ in range(count)]
+
+
+def test_to_price_row_kr_uses_close_as_adjusted():
+    """KIS 응답은 YYYYMMDD 날짜를 변환하고 수정 종가로 종가를 사용"""
+    row = _collector()._to_price_row(1, {
+        'trade_date': '20240105',
+        'open_price': '70000',
+        'high_price': '71500',
+        'low_price': '69800',
+        'close_price': '71000',
+        'volume': '1234567',
+    }, KR_MARKET)
+
+    assert row['stock_id'] == 1
+    assert row['trade_date'] == date(2024, 1, 5)
+    assert row['open_price'] == 70000.0
+    assert row['close_price'] == row['adjusted_close_price'] == 71000.0
+    assert row['volume'] == 1234567
+    assert row['data_source'] == 'kis_api'
+    assert row['daily_return_pct'] is None
+
+
+def test_to_price_row_us_reads_adjusted_close():
+    """Alpha Vantage 응답은 ISO 날짜와 adjusted_close 필드를 사용"""
+    row = _collector()._to_price_row(2, {
+        'date': '2024-01-05',
+        'open': '181.99',
+        'high': '182.76',
+        'low': '180.17',
+        'close': '181.18',
+        'adjusted_close': '180.50',
+        'volume': '62303300',
+    }, US_MARKET)
+
+    assert row['trade_date'] == date(2024, 1, 5)
+    assert row['high_price'] == 182.76
+    assert row['close_price'] == 181.18
+    assert row['adjusted_close_price'] == 180.50
+    assert row['volume'] == 62303300
+    assert row['data_source'] == 'alpha_vantage_api'
+
+
+@pytest.mark.anyio
+async def test_write_daily_prices_inserts_small_batch():
+    """COPY_MIN_ROWS 미만은 ON CONFLICT INSERT 로 저장하고 실제 삽입 건수를 종목별로 반환"""
+    collector = _collector()
+    collector._copy_daily_prices = AsyncMock()
+    db = AsyncMock()
+    db.execute.return_value = [(1,), (1,), (2,)]
+    rows = _rows(2) + _rows(2, stock_id=2)
+
+    inserted = await collector._write_daily_prices(db, rows)
+
+    assert inserted == Counter({1: 2, 2: 1})
+    db.execute.assert_awaited_once_with(INSERT_DAILY_PRICES, rows)
+    db.commit.assert_awaited_once()
+    collector._copy_daily_prices.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_write_daily_prices_copies_large_batch():
+    """COPY_MIN_ROWS 이상은 COPY 경로로 저장"""
+    collector = _collector()
+    collector._copy_daily_prices = AsyncMock(return_value=Counter({1: COPY_MIN_ROWS}))
+    db = AsyncMock()
+    rows = _rows(COPY_MIN_ROWS)
+
+    assert await collector._write_daily_prices(db, rows) == Counter({1: COPY_MIN_ROWS})
+    collector._copy_daily_prices.assert_awaited_once_with(db, rows)
+    db.execute.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_write_daily_prices_rolls_back_failed_batch():
+    """저장 실패 시 해당 배치만 롤백하고 빈 Counter 반환"""
+    collector = _collector()
+    db = AsyncMock()
+    db.execute.side_effect = SQLAlchemyError("insert failed")
+
+    assert await collector._write_daily_prices(db, _rows(3)) == Counter()
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_write_daily_prices_skips_empty_batch():
+    """빈 배치는 DB 를 호출하지 않음"""
+    db = AsyncMock()
+
+    assert await _collector()._write_daily_prices(db, []) == Counter()
+    db.execute.assert_not_awaited()
+    db.commit.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    test_to_price_row_kr_uses_close_as_adjusted()
+    test_to_price_row_us_reads_adjusted_close()
+    print("✅ 가격 행 변환 단위 테스트 통과")